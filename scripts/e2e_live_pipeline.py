@@ -32,7 +32,7 @@ from shared.config import get_settings
 from shared.database.models import Article, ArticleAnalysis
 from shared.database.session import create_engine_from_settings, get_session_maker
 from shared.services.analyzers import ClaudeAnalyzer, GeminiAnalyzer, OpenAIAnalyzer, run_all_analyzers
-from shared.services.discord import discord_notifier
+from shared.services.discord import count_sentiments, discord_notifier
 from shared.services.firecrawl import FirecrawlClient
 from shared.services.news_api import StockNewsClient, filter_new_articles
 
@@ -98,7 +98,7 @@ async def main() -> None:
                 news_url=item.news_url,
                 title=item.title,
                 source=item.source_name,
-                published_at=item.published_at(),
+                published_at=item.published_at,
                 topics=item.topics,
                 api_sentiment=item.sentiment,
                 raw_api_response=item.model_dump(),
@@ -123,6 +123,7 @@ async def main() -> None:
         await session.commit()
 
     await engine.dispose()
+    await discord_notifier.close()
     logger.info("Completed pipeline. inserted=%s", len(inserted_articles))
 
 
@@ -141,6 +142,8 @@ async def _process_article(session, article: Article, settings, logger):
             await _mark_scrape_failed(session, article.id)
             await session.commit()
             return
+        finally:
+            await scraper.close()
     elif not youtube_link:
         logger.warning("FIRECRAWL_API_KEY not set; skipping scrape for %s", article.id)
 
@@ -247,8 +250,11 @@ async def _send_notification_if_needed(article: Article, results: list, logger)
         for provider, model_name, res in results
     ]
     
-    # Check if should send alert
-    if not discord_notifier.should_send_alert(analyses_dicts, consensus_sentiment, avg_impact_score):
+    # Check if should send alert; the sentiment tally is reused for the alert footer
+    sentiment_tally = count_sentiments(analyses_dicts)
+    if not discord_notifier.should_send_alert(
+        analyses_dicts, consensus_sentiment, avg_impact_score, sentiment_counts=sentiment_tally
+    ):
         logger.info(
             f"Article {article.id} does not meet alert criteria: "
             f"sentiment={consensus_sentiment}, impact={avg_impact_score:.2f}"
@@ -281,6 +287,7 @@ async def _send_notification_if_needed(article: Article, results: list, logger)
             avg_impact_score=avg_impact_score,
             analyses=analyses_dicts,
             key_topics=unique_topics,
+            sentiment_counts=sentiment_tally,
         )
         logger.info(f"✅ Sent Discord notification for article {article.id}")
     except Exception as e:
@@ -13,9 +13,10 @@ from typing import Iterable
 
 from shared.config import Settings, get_settings
 from sqlalchemy.engine.url import make_url
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.sql import text
 
-from shared.database.models import Base
+from shared.database.models import ARTICLE_SEARCH_TSV_SQL, Base
 from shared.database.session import create_engine_from_settings, init_models
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,7 @@ async def initialize_database(settings: Settings) -> None:
     logger.info("Initializing database schema...")
     await init_models(engine)
     await _ensure_confidence_column(engine)
+    await _ensure_search_indexes(engine)
 
     await _log_tables(engine)
     await engine.dispose()
@@ -124,6 +126,58 @@ async def _ensure_confidence_column(engine) -> None:
             )
 
 
+async def _ensure_search_indexes(engine) -> None:
+    """
+    Add the generated search_tsv column, article list indexes and trigram indexes if missing.
+    create_all only builds indexes for new tables, so existing databases need these explicitly.
+    Trigram indexes are optional: without pg_trgm, substring search still works, just unindexed.
+    """
+    async with engine.begin() as conn:
+        logger.info("Ensuring articles.search_tsv and list indexes...")
+        await conn.execute(
+            text(
+                f"""
+                ALTER TABLE articles
+                ADD COLUMN IF NOT EXISTS search_tsv tsvector
+                GENERATED ALWAYS AS ({ARTICLE_SEARCH_TSV_SQL}) STORED;
+                """
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_articles_search_tsv "
+                "ON articles USING gin (search_tsv);"
+            )
+        )
+        await conn.execute(
+            text(
+                """
+                CREATE INDEX IF NOT EXISTS idx_articles_published_created
+                ON articles (published_at DESC NULLS LAST, created_at DESC);
+                """
+            )
+        )
+
+    # Separate transaction so a refused extension doesn't roll back the indexes above
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+            await conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS idx_articles_title_trgm "
+                    "ON articles USING gin (title gin_trgm_ops);"
+                )
+            )
+            await conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS idx_articles_content_trgm "
+                    "ON articles USING gin (scraped_content gin_trgm_ops);"
+                )
+            )
+    except DBAPIError as exc:
+        logger.warning("Skipping trigram search indexes (pg_trgm unavailable): %s", exc)
+
+
 def main() -> None:
     settings = get_settings()
     configure_logging(settings.LOG_LEVEL)
@@ -152,12 +152,15 @@ async def main() -> None:
             return
 
         notifier = DiscordNotifier(digests_webhook=webhook)
-        message_id = await notifier.send_digest(
-            digest_type=digest_type,
-            articles=ranked,
-            period_start=period_start,
-            period_end=period_end,
-        )
+        try:
+            message_id = await notifier.send_digest(
+                digest_type=digest_type,
+                articles=ranked,
+                period_start=period_start,
+                period_end=period_end,
+            )
+        finally:
+            await notifier.close()
 
         digest_row = Digest(
             digest_type=digest_type,
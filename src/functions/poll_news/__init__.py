@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 import azure.functions as func
@@ -14,7 +15,7 @@ from sqlalchemy.engine.url import make_url
 
 from shared.config import get_settings
 from shared.database.models import Article
-from shared.database.session import create_engine_from_settings, get_session_maker
+from shared.database.session import get_session_maker
 from shared.schemas.queue_messages import ArticleQueueMessage
 from shared.services.news_api import StockNewsClient, filter_new_articles, is_paywalled
 from shared.services.queue import QueueService
@@ -23,6 +24,12 @@ logger = logging.getLogger(__name__)
 ET = ZoneInfo("America/New_York")
 
 
+@lru_cache(maxsize=1)
+def _get_queue(connection_string: str, queue_name: str) -> QueueService:
+    # One client per worker; ensure_queue() only creates the queue on the first invocation
+    return QueueService(connection_string=connection_string, queue_name=queue_name)
+
+
 def _should_run_now(now_utc: datetime) -> bool:
     """
     Weekdays: run every invocation (configured for 5 min).
@@ -47,18 +54,16 @@ async def main(timer: func.TimerRequest) -> None:
         logger.info("Weekend invocation outside top-of-hour; skipping poll.")
         return
 
-    engine = create_engine_from_settings(settings)
     safe_url = make_url(settings.DATABASE_URL).render_as_string(hide_password=True)
     logger.info("Polling StockNewsAPI and writing to database: %s", safe_url)
 
     client = StockNewsClient(settings.STOCKNEWS_API_KEY)
-    session_maker = get_session_maker(engine)
+    session_maker = get_session_maker()
 
     try:
         articles = await client.fetch_latest(items=50, section="general", page=1)
     except Exception as exc:  # http errors or validation issues
         logger.exception("Failed to fetch StockNewsAPI articles: %s", exc)
-        await engine.dispose()
         return
 
     urls = [item.news_url for item in articles]
@@ -84,7 +89,6 @@ async def main(timer: func.TimerRequest) -> None:
                 skipped_paywall,
                 skipped_duplicates,
             )
-            await engine.dispose()
             return
 
         to_insert: list[Article] = []
@@ -94,7 +98,7 @@ async def main(timer: func.TimerRequest) -> None:
                     news_url=item.news_url,
                     title=item.title,
                     source=item.source_name,
-                    published_at=item.published_at(),
+                    published_at=item.published_at,
                     topics=item.topics,
                     api_sentiment=item.sentiment,
                     raw_api_response=item.model_dump(),
@@ -106,26 +110,30 @@ async def main(timer: func.TimerRequest) -> None:
         new_articles_count = len(to_insert)
 
         if settings.AZURE_STORAGE_CONNECTION_STRING:
-            queue = QueueService(
-                connection_string=settings.AZURE_STORAGE_CONNECTION_STRING,
-                queue_name=settings.QUEUE_NAME,
-            )
-            for article in to_insert:
-                try:
-                    await queue.send_article_message(
-                        ArticleQueueMessage(
-                            article_id=article.id,
-                            news_url=article.news_url,
-                            source=article.source,
-                            published_at=article.published_at,
+            queue = _get_queue(settings.AZURE_STORAGE_CONNECTION_STRING, settings.QUEUE_NAME)
+            messages = [
+                ArticleQueueMessage(
+                    article_id=article.id,
+                    news_url=article.news_url,
+                    source=article.source,
+                    published_at=article.published_at,
+                )
+                for article in to_insert
+            ]
+            try:
+                await queue.ensure_queue()
+                errors = await queue.send_article_messages(messages)
+            except Exception as exc:
+                logger.exception("Failed to enqueue %s articles: %s", len(messages), exc)
+            else:
+                for article, exc in zip(to_insert, errors, strict=True):
+                    if exc is not None:
+                        logger.error(
+                            "Failed to enqueue article %s: %s", article.id, exc, exc_info=exc
                         )
-                    )
-                except Exception as exc:
-                    logger.exception("Failed to enqueue article %s: %s", article.id, exc)
         else:
             logger.warning("AZURE_STORAGE_CONNECTION_STRING not set; skipping queue enqueue.")
 
-    await engine.dispose()
     logger.info(
         "Poll complete. fetched=%s inserted=%s paywalled=%s duplicates=%s",
         len(articles),
@@ -8,6 +8,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Iterable
 from urllib.parse import urlparse
 
@@ -18,7 +19,7 @@ from sqlalchemy.orm import selectinload
 
 from shared.config import get_settings
 from shared.database.models import Article, ArticleAnalysis
-from shared.database.session import create_engine_from_settings, get_session_maker
+from shared.database.session import get_session_maker
 from shared.schemas.analysis import AnalysisResult
 from shared.schemas.queue_messages import ArticleQueueMessage
 from shared.services.analyzers import (
@@ -27,12 +28,18 @@ from shared.services.analyzers import (
     OpenAIAnalyzer,
     run_all_analyzers,
 )
-from shared.services.discord import discord_notifier
+from shared.services.discord import count_sentiments, discord_notifier
 from shared.services.firecrawl import FirecrawlClient
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_scraper(api_key: str) -> FirecrawlClient:
+    # One client per worker so warm invocations reuse the open Firecrawl connection
+    return FirecrawlClient(api_key)
+
+
 async def main(msg: func.QueueMessage) -> None:
     settings = get_settings()
     logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO))
@@ -44,8 +51,7 @@ async def main(msg: func.QueueMessage) -> None:
         logger.exception("Invalid queue message: %s", exc)
         return
 
-    engine = create_engine_from_settings(settings)
-    session_maker = get_session_maker(engine)
+    session_maker = get_session_maker()
 
     async with session_maker() as session:
         article = await session.scalar(
@@ -53,7 +59,6 @@ async def main(msg: func.QueueMessage) -> None:
         )
         if not article:
             logger.warning("Article %s not found; skipping.", qmsg.article_id)
-            await engine.dispose()
             return
 
         # Scrape content (skip Firecrawl for YouTube links)
@@ -63,7 +68,7 @@ async def main(msg: func.QueueMessage) -> None:
         if youtube_link:
             logger.info("YouTube link; skipping scrape for article %s", article.id)
         elif settings.FIRECRAWL_API_KEY:
-            scraper = FirecrawlClient(settings.FIRECRAWL_API_KEY)
+            scraper = _get_scraper(settings.FIRECRAWL_API_KEY)
             try:
                 content = await _retry_async(lambda: scraper.scrape(article.news_url))
             except Exception as exc:
@@ -88,14 +93,12 @@ async def main(msg: func.QueueMessage) -> None:
             article.scraped_at = datetime.now(timezone.utc)
             article.scrape_failed = True
             await session.commit()
-            await engine.dispose()
             return
 
         analyzers = _build_analyzers(settings, article.news_url)
 
         if not analyzers:
             logger.warning("No LLM API keys configured (or none applicable); skipping analysis.")
-            await engine.dispose()
             return
 
         try:
@@ -111,7 +114,6 @@ async def main(msg: func.QueueMessage) -> None:
             )
         except Exception as exc:
             logger.exception("Analysis failed for article %s: %s", article.id, exc)
-            await engine.dispose()
             return
 
         await _persist_results(session, article.id, results)
@@ -119,7 +121,8 @@ async def main(msg: func.QueueMessage) -> None:
         # Send Discord notification if criteria met
         await _send_notification_if_needed(article, results)
 
-    await engine.dispose()
+    # Let the alert finish before returning: the host may freeze the worker once the invocation ends
+    await discord_notifier.drain()
     logger.info("Processed article %s", qmsg.article_id)
 
 
@@ -193,8 +196,11 @@ async def _send_notification_if_needed(article: Article, results: list[tuple[str
         for provider, model_name, res in results
     ]
     
-    # Check if should send alert
-    if not discord_notifier.should_send_alert(analyses_dicts, consensus_sentiment, avg_impact_score):
+    # Check if should send alert; the sentiment tally is reused for the alert footer
+    sentiment_tally = count_sentiments(analyses_dicts)
+    if not discord_notifier.should_send_alert(
+        analyses_dicts, consensus_sentiment, avg_impact_score, sentiment_counts=sentiment_tally
+    ):
         logger.info(
             f"Article {article.id} does not meet alert criteria: "
             f"sentiment={consensus_sentiment}, impact={avg_impact_score:.2f}"
@@ -214,9 +220,9 @@ async def _send_notification_if_needed(article: Article, results: list[tuple[str
             seen.add(topic.lower())
             unique_topics.append(topic)
     
-    # Send notification
+    # Send notification in the background; main() drains it once the DB session is released
     try:
-        await discord_notifier.send_article_alert(
+        discord_notifier.fire_and_forget_alert(
             article_id=article.id,
             title=article.title,
             source=article.source,
@@ -227,9 +233,12 @@ async def _send_notification_if_needed(article: Article, results: list[tuple[str
             avg_impact_score=avg_impact_score,
             analyses=analyses_dicts,
             key_topics=unique_topics,
+            sentiment_counts=sentiment_tally,
         )
     except Exception as e:
-        logger.error(f"Failed to send notification for article {article.id}: {e}", exc_info=True)
+        logger.error(
+            f"Failed to schedule notification for article {article.id}: {e}", exc_info=True
+        )
 
 
 def _build_analyzers(settings, news_url: str | None):
@@ -5,8 +5,7 @@ Timer-triggered function: aggregate recent analyses and publish Discord digests.
 from __future__ import annotations
 
 import logging
-from collections import Counter
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, time, timedelta, timezone
 from typing import Iterable
 from zoneinfo import ZoneInfo
 
@@ -25,7 +24,7 @@ from sqlalchemy.orm import selectinload
 
 from shared.config import get_settings
 from shared.database.models import Article, Digest, DigestArticle
-from shared.database.session import create_engine_from_settings, get_session_maker
+from shared.database.session import get_session_maker
 from shared.services.discord import discord_notifier
 
 logger = logging.getLogger(__name__)
@@ -44,6 +43,20 @@ DIGEST_WINDOWS = (
     {"digest_type": "weekly", "hour": 12, "minute": 0, "weekdays": {5}},  # Saturday
 )
 
+# DIGEST_WINDOWS resolved once into (digest_type, weekdays, start, end) wall-clock ranges
+_DIGEST_SCHEDULE: tuple[tuple[str, frozenset[int], time, time], ...] = tuple(
+    (
+        window["digest_type"],
+        frozenset(window["weekdays"]),
+        time(window["hour"], window["minute"]),
+        (datetime(2000, 1, 1, window["hour"], window["minute"]) + DISPATCH_TOLERANCE).time(),
+    )
+    for window in DIGEST_WINDOWS
+)
+
+# Sort fallback for articles without a published_at, so they rank last among ties
+_OLDEST_PUBLISHED = datetime.min.replace(tzinfo=timezone.utc)
+
 # Fallback lookback windows when no prior digest exists
 DEFAULT_LOOKBACK = {
     "premarket": timedelta(hours=24),
@@ -71,8 +84,7 @@ async def main(timer: func.TimerRequest) -> None:  # noqa: ARG001
     scheduled_utc = scheduled_et.astimezone(timezone.utc)
     logger.info("Starting %s digest for window ending %s ET", digest_type, scheduled_et.isoformat())
 
-    engine = create_engine_from_settings(settings)
-    session_maker = get_session_maker(engine)
+    session_maker = get_session_maker()
 
     async with session_maker() as session:
         last_digest = await session.scalar(
@@ -85,7 +97,6 @@ async def main(timer: func.TimerRequest) -> None:  # noqa: ARG001
             logger.info(
                 "%s digest already recorded at %s; skipping.", digest_type, last_digest.sent_at.isoformat()
             )
-            await engine.dispose()
             return
 
         period_start = calculate_period_start(digest_type, last_digest.sent_at if last_digest else None, now_utc)
@@ -125,7 +136,6 @@ async def main(timer: func.TimerRequest) -> None:  # noqa: ARG001
 
         await session.commit()
 
-    await engine.dispose()
     logger.info("Completed %s digest with %s articles", digest_type, len(ranked))
 
 
@@ -133,18 +143,14 @@ def determine_pending_digest(now_et: datetime) -> tuple[str, datetime] | None:
     """
     Return the digest type and scheduled ET datetime if within the dispatch tolerance window.
     """
-    for window in DIGEST_WINDOWS:
-        if now_et.weekday() not in window["weekdays"]:
-            continue
-
-        target = now_et.replace(
-            hour=window["hour"],
-            minute=window["minute"],
-            second=0,
-            microsecond=0,
-        )
-        if target <= now_et <= target + DISPATCH_TOLERANCE:
-            return window["digest_type"], target
+    weekday = now_et.weekday()
+    clock = now_et.time()
+    for digest_type, weekdays, start, end in _DIGEST_SCHEDULE:
+        if weekday in weekdays and start <= clock <= end:
+            slot_start = now_et.replace(
+                hour=start.hour, minute=start.minute, second=0, microsecond=0
+            )
+            return digest_type, slot_start
     return None
 
 
@@ -184,16 +190,33 @@ def rank_articles(articles: Iterable[Article]) -> list[dict]:
         if not analyses:
             continue
 
-        sentiments = [str(a.sentiment or "").lower() for a in analyses if a.sentiment]
-        sentiment_counts = Counter(sentiments)
-        consensus = len(sentiment_counts) == 1 and len(analyses) >= 3
-
-        avg_sentiment = _average([a.sentiment_score for a in analyses])
-        avg_impact = _average([a.impact_score for a in analyses])
-        if avg_sentiment is None or avg_impact is None:
+        # One pass over the analyses: sentiment tally plus running sums for both averages
+        sentiment_counts: dict[str, int] = {}
+        sentiment_sum = impact_sum = 0.0
+        sentiment_n = impact_n = 0
+        for analysis in analyses:
+            if analysis.sentiment:
+                label = str(analysis.sentiment).lower()
+                sentiment_counts[label] = sentiment_counts.get(label, 0) + 1
+            if analysis.sentiment_score is not None:
+                sentiment_sum += float(analysis.sentiment_score)
+                sentiment_n += 1
+            if analysis.impact_score is not None:
+                impact_sum += float(analysis.impact_score)
+                impact_n += 1
+        if not sentiment_n or not impact_n:
             continue
 
-        leader = sentiment_counts.most_common(1)[0][0] if sentiment_counts else "neutral"
+        consensus = len(sentiment_counts) == 1 and len(analyses) >= 3
+        avg_sentiment = sentiment_sum / sentiment_n
+        avg_impact = impact_sum / impact_n
+
+        # max() keeps the first label among equal counts, like Counter.most_common
+        leader = (
+            max(sentiment_counts, key=sentiment_counts.__getitem__)
+            if sentiment_counts
+            else "neutral"
+        )
         sentiment_strength = abs(avg_sentiment)
 
         ranked.append(
@@ -211,25 +234,14 @@ def rank_articles(articles: Iterable[Article]) -> list[dict]:
             }
         )
 
-    ranked.sort(
-        key=lambda item: (
-            item["consensus"],
-            item["sentiment_strength"],
-            item["avg_impact_score"],
-            item["published_at"] or datetime.min.replace(tzinfo=timezone.utc),
-        ),
-        reverse=True,
-    )
+    ranked.sort(key=_rank_key, reverse=True)
     return ranked
 
 
-def _average(values: Iterable[float | None]) -> float | None:
-    """
-    Compute a safe average, converting Decimals to float and skipping None values.
-    """
-    cleaned = [float(v) for v in values if v is not None]
-    if not cleaned:
-        return None
-    return sum(cleaned) / len(cleaned)
-
-
+def _rank_key(item: dict) -> tuple[bool, float, float, datetime]:
+    return (
+        item["consensus"],
+        item["sentiment_strength"],
+        item["avg_impact_score"],
+        item["published_at"] or _OLDEST_PUBLISHED,
+    )
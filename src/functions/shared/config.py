@@ -2,11 +2,16 @@
 Application configuration using Pydantic settings.
 """
 
+import re
+from dataclasses import dataclass
 from functools import lru_cache
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Only the async Postgres driver is supported
+_DSN_RE = re.compile(r"^postgresql\+asyncpg://")
+
 
 class Settings(BaseSettings):
     """
@@ -43,10 +48,10 @@ class Settings(BaseSettings):
     @field_validator("DATABASE_URL")
     @classmethod
     def _validate_database_url(cls, value: str) -> str:
-        if not value.startswith("postgresql"):
-            raise ValueError("DATABASE_URL must start with 'postgresql'")
-        if "+asyncpg" not in value:
-            raise ValueError("DATABASE_URL must use the async driver, e.g. postgresql+asyncpg://")
+        if not _DSN_RE.match(value):
+            raise ValueError(
+                "DATABASE_URL must be a PostgreSQL URL using the async driver, e.g. postgresql+asyncpg://"
+            )
         return value
 
 
@@ -58,3 +63,28 @@ def get_settings() -> Settings:
 
     return Settings()
 
+
+@dataclass(frozen=True, slots=True)
+class RuntimeCfg:
+    """
+    Plain snapshot of the settings read on hot paths (alert gating, webhooks).
+    """
+
+    discord_alerts: str | None
+    discord_digests: str | None
+    impact_threshold: float
+
+
+@lru_cache
+def get_runtime_cfg() -> RuntimeCfg:
+    """
+    Cached RuntimeCfg built once from get_settings().
+    """
+
+    settings = get_settings()
+    return RuntimeCfg(
+        discord_alerts=settings.DISCORD_WEBHOOK_ALERTS,
+        discord_digests=settings.DISCORD_WEBHOOK_DIGESTS,
+        impact_threshold=settings.IMPACT_THRESHOLD,
+    )
+
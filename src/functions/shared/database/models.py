@@ -8,6 +8,7 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Computed,
     DateTime,
     ForeignKey,
     Index,
@@ -19,11 +20,16 @@ from sqlalchemy import (
     func,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import declarative_base, deferred, relationship
 
 Base = declarative_base()
 
+# Shared with scripts/init_db.py, which adds the column to existing databases
+ARTICLE_SEARCH_TSV_SQL = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(scraped_content, ''))"
+)
+
 
 class Article(Base):
     __tablename__ = "articles"
@@ -32,6 +38,14 @@ class Article(Base):
         Index("idx_articles_created_at", text("created_at DESC")),
         Index("idx_articles_source", "source"),
         Index("idx_articles_scrape_failed", "scrape_failed", postgresql_where=text("scrape_failed = TRUE")),
+        Index("idx_articles_search_tsv", "search_tsv", postgresql_using="gin"),
+        # Trigram indexes on title/scraped_content need pg_trgm, which not every managed
+        # Postgres allows; scripts/init_db.py creates them when the extension is available.
+        Index(
+            "idx_articles_published_created",
+            text("published_at DESC NULLS LAST"),
+            text("created_at DESC"),
+        ),
     )
 
     id = Column(Integer, primary_key=True)
@@ -47,6 +61,8 @@ class Article(Base):
     scrape_failed = Column(Boolean, nullable=False, server_default=text("FALSE"))
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     included_in_digest_at = Column(DateTime(timezone=True))
+    # Generated full-text search vector; deferred so list queries don't ship it back
+    search_tsv = deferred(Column(TSVECTOR, Computed(ARTICLE_SEARCH_TSV_SQL, persisted=True)))
 
     analyses = relationship(
         "ArticleAnalysis", back_populates="article", cascade="all, delete-orphan", lazy="selectin"
@@ -5,19 +5,124 @@ LLM analyzers for Claude, GPT-4o, and Gemini.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
-from dataclasses import dataclass
-from typing import Any, Callable, Coroutine, Optional
+import string
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, ClassVar, Coroutine, Mapping, Optional, Sequence
 
-import google.generativeai as genai
-from anthropic import AsyncAnthropic
-from openai import AsyncOpenAI
-from pydantic import ValidationError
+import httpx
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from shared.schemas.analysis import AnalysisResult
+from shared.services.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+ANTHROPIC_MESSAGES_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_VERSION = "2023-06-01"
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/models"
+
+# Provider names stored on each analysis row and used as keys for per-provider settings
+PROVIDER_ANTHROPIC = "anthropic"
+PROVIDER_OPENAI = "openai"
+PROVIDER_GOOGLE = "google"
+
+# Built once so each parse goes straight to the compiled pydantic-core validator
+_ANALYSIS_ADAPTER: TypeAdapter[AnalysisResult] = TypeAdapter(AnalysisResult)
+
+# Parsed results keyed by (provider, model, prompt) digest. Syndicated articles often arrive
+# with identical bodies, and retries re-run every analyzer, so repeats skip the LLM call.
+RESULT_CACHE_SIZE = 4096
+_RESULT_CACHE: OrderedDict[bytes, AnalysisResult] = OrderedDict()
+
+# Per-provider cap on article characters (~4 chars/token) so oversized scrapes don't blow the
+# request size or context window
+_CONTENT_BUDGETS: dict[str, int] = {
+    PROVIDER_ANTHROPIC: 60_000,
+    PROVIDER_OPENAI: 30_000,
+    PROVIDER_GOOGLE: 100_000,
+}
+_TRUNCATION_MARKER = "\n...[TRUNCATED]...\n"
+
+# Gemini calls are the slowest and largest; cap how many are in flight per worker so a burst
+# of articles waits here instead of piling open streams (and their buffers) onto the pool
+GEMINI_MAX_CONCURRENCY = 5
+# One semaphore per event loop: asyncio primitives bind to the loop that first waits on them, and
+# scripts/tests/recycled workers may call asyncio.run() more than once per process
+_GEMINI_SEMAPHORES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+_GEMINI_SLOW_ACQUIRE_SECONDS = 1.0
+
+# JSON schemas handed to the providers' structured-output modes. Kept to the subset that
+# OpenAI strict mode accepts; ranges are still enforced by AnalysisResult on parse.
+_METRICS_PROPERTIES: dict[str, Any] = {
+    "sentiment": {"type": "string", "enum": ["Bullish", "Bearish", "Neutral"]},
+    "sentiment_score": {
+        "type": "number",
+        "description": "-1.0 (most bearish) to 1.0 (most bullish)",
+    },
+    "confidence": {"type": "number", "description": "0.0 (lowest) to 1.0 (highest)"},
+    "impact_score": {
+        "type": "number",
+        "description": "0.0 (minimal impact) to 1.0 (major market-moving)",
+    },
+    "key_topics": {"type": "array", "items": {"type": "string"}},
+}
+_METRICS_JSON_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": _METRICS_PROPERTIES,
+    "required": list(_METRICS_PROPERTIES),
+    "additionalProperties": False,
+}
+_ANALYSIS_JSON_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {"summary": {"type": "string"}, **_METRICS_PROPERTIES},
+    "required": ["summary", *_METRICS_PROPERTIES],
+    "additionalProperties": False,
+}
+_OPENAI_METRICS_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {"name": "analysis", "schema": _METRICS_JSON_SCHEMA, "strict": True},
+}
+_OPENAI_BATCH_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "analyses",
+        "schema": {
+            "type": "object",
+            "properties": {"analyses": {"type": "array", "items": _METRICS_JSON_SCHEMA}},
+            "required": ["analyses"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+_CLAUDE_ANALYSIS_TOOL: dict[str, Any] = {
+    "name": "record_analysis",
+    "description": "Record the structured market analysis of the article.",
+    "input_schema": _ANALYSIS_JSON_SCHEMA,
+}
+
+# Static request-body fragments, serialized once; per call only the model and prompt are spliced in
+_CLAUDE_BODY_TAIL = (
+    b',"max_tokens":1024,"stream":true,"tools":['
+    + orjson.dumps(_CLAUDE_ANALYSIS_TOOL)
+    + b'],"tool_choice":{"type":"tool","name":"record_analysis"},'
+    + b'"messages":[{"role":"user","content":'
+)
+_OPENAI_BODY_TAIL = (
+    b',"max_tokens":400,"stream":true,"response_format":'
+    + orjson.dumps(_OPENAI_METRICS_FORMAT)
+    + b',"messages":[{"role":"user","content":'
+)
+
 PROMPT_TEMPLATE = """You are a financial news analyst specializing in market sentiment analysis for futures traders.
 
 Analyze the following news article and provide a structured assessment.
@@ -168,24 +273,178 @@ Focus on implications for:
 Return ONLY the JSON object, no additional text.
 """
 
+BATCH_METRICS_PROMPT_TEMPLATE = """You are a financial news analyst specializing in market \
+sentiment analysis for futures traders.
 
-def _build_prompt(title: str, source: str | None, published_at: Any, content: str, include_summary: bool = True) -> str:
-    template = PROMPT_TEMPLATE if include_summary else METRICS_PROMPT_TEMPLATE
-    return template.format(
-        title=title,
-        source=source or "Unknown",
-        published_at=published_at or "Unknown",
-        content=content,
-    )
+Analyze each of the following {count} news articles independently and provide ONLY the \
+sentiment, impact, and key topics (no summary).
+
+{articles}
+Provide your analysis in the following JSON format, with one object per article in the order given:
+{{
+  "analyses": [
+    {{
+      "sentiment": "Bullish" | "Bearish" | "Neutral",
+      "sentiment_score": <float from -1.0 (most bearish) to 1.0 (most bullish)>,
+      "confidence": <float from 0.0 (lowest confidence) to 1.0 (highest confidence)>,
+      "impact_score": <float from 0.0 (minimal impact) to 1.0 (major market-moving)>,
+      "key_topics": ["list", "of", "relevant", "entities", "and", "topics"]
+    }}
+  ]
+}}
 
+SCORING GUIDELINES:
+- Sentiment: Consider implications for S&P 500, Nasdaq, and Gold futures
+- Impact Score:
+  - 0.0-0.3: Routine news, minor market relevance
+  - 0.4-0.6: Notable news, moderate market relevance
+  - 0.7-0.9: Significant news, high market relevance
+  - 0.9-1.0: Major market-moving event (Fed decisions, major economic data, geopolitical events)
 
-def _build_youtube_prompt(title: str, source: str | None, published_at: Any, include_summary: bool = True) -> str:
-    template = YOUTUBE_PROMPT_TEMPLATE if include_summary else YOUTUBE_METRICS_PROMPT_TEMPLATE
-    return template.format(
-        title=title,
-        source=source or "Unknown",
-        published_at=published_at or "Unknown",
+Focus on implications for:
+- ES (S&P 500 E-mini futures)
+- NQ (Nasdaq E-mini futures)
+- GC (Gold futures)
+- Federal Reserve / FOMC policy
+- Major economic indicators
+
+Return ONLY the JSON object, no additional text.
+"""
+
+BATCH_ARTICLE_TEMPLATE = """### Article {index}
+Title: {title}
+Source: {source}
+Published: {published_at}
+Content:
+{content}
+"""
+
+
+class _PromptTemplate:
+    """
+    Prompt template pre-split at its placeholders.
+
+    Static fragments are kept both as text and as JSON-escaped bytes, so a request body
+    only has to escape the dynamic fields on each call.
+    """
+
+    __slots__ = ("_literals", "_fields", "_json_literals")
+
+    def __init__(self, template: str) -> None:
+        literals: list[str] = []
+        fields: list[str] = []
+        pending = ""
+        for literal, field_name, _spec, _conv in string.Formatter().parse(template):
+            # Escaped braces ("{{") arrive as separate literal-only chunks
+            pending += literal
+            if field_name is not None:
+                literals.append(pending)
+                fields.append(field_name)
+                pending = ""
+        literals.append(pending)
+        self._literals = tuple(literals)
+        self._fields = tuple(fields)
+        self._json_literals = tuple(orjson.dumps(lit)[1:-1] for lit in literals)
+
+    def render(self, values: dict[str, str]) -> str:
+        out = [self._literals[0]]
+        for name, literal in zip(self._fields, self._literals[1:], strict=True):
+            out.append(values[name])
+            out.append(literal)
+        return "".join(out)
+
+    def render_json(self, values: dict[str, str]) -> bytes:
+        """Render as a JSON string literal (quotes included) ready to splice into a body."""
+        out = [b'"', self._json_literals[0]]
+        for name, literal in zip(self._fields, self._json_literals[1:], strict=True):
+            out.append(orjson.dumps(values[name])[1:-1])
+            out.append(literal)
+        out.append(b'"')
+        return b"".join(out)
+
+
+_ARTICLE_TEMPLATES = {
+    True: _PromptTemplate(PROMPT_TEMPLATE),
+    False: _PromptTemplate(METRICS_PROMPT_TEMPLATE),
+}
+_YOUTUBE_TEMPLATES = {
+    True: _PromptTemplate(YOUTUBE_PROMPT_TEMPLATE),
+    False: _PromptTemplate(YOUTUBE_METRICS_PROMPT_TEMPLATE),
+}
+_BATCH_TEMPLATE = _PromptTemplate(BATCH_METRICS_PROMPT_TEMPLATE)
+_BATCH_ARTICLE = _PromptTemplate(BATCH_ARTICLE_TEMPLATE)
+
+
+def _prompt_values(
+    title: str, source: str | None, published_at: Any, content: str = ""
+) -> dict[str, str]:
+    return {
+        "title": str(title),
+        "source": source or "Unknown",
+        "published_at": str(published_at or "Unknown"),
+        "content": content,
+    }
+
+
+def _build_prompt_json(
+    title: str, source: str | None, published_at: Any, content: str, include_summary: bool = True
+) -> bytes:
+    values = _prompt_values(title, source, published_at, content)
+    return _ARTICLE_TEMPLATES[include_summary].render_json(values)
+
+
+def _build_youtube_prompt_json(
+    title: str, source: str | None, published_at: Any, include_summary: bool = True
+) -> bytes:
+    values = _prompt_values(title, source, published_at)
+    return _YOUTUBE_TEMPLATES[include_summary].render_json(values)
+
+
+def _truncate_for_budget(content: str, max_chars: int) -> str:
+    """Keep the head and tail of over-long content (3:1), where leads and conclusions live."""
+    if len(content) <= max_chars:
+        return content
+    head = content[: max_chars * 3 // 4]
+    tail = content[-(max_chars // 4):]
+    return f"{head}{_TRUNCATION_MARKER}{tail}"
+
+
+def _build_batch_prompt(articles: Sequence[Mapping[str, Any]]) -> str:
+    blocks = "\n".join(
+        _BATCH_ARTICLE.render(
+            {
+                "index": str(index),
+                **_prompt_values(
+                    article["title"],
+                    article.get("source"),
+                    article.get("published_at"),
+                    article["content"],
+                ),
+            }
+        )
+        for index, article in enumerate(articles, 1)
     )
+    return _BATCH_TEMPLATE.render({"count": str(len(articles)), "articles": blocks})
+
+
+def _chunk_for_context(
+    articles: Sequence[Mapping[str, Any]], max_prompt_tokens: int, max_batch_size: int
+) -> list[list[Mapping[str, Any]]]:
+    """Split articles into batches whose estimated prompt size (~4 chars/token) fits the budget."""
+    batches: list[list[Mapping[str, Any]]] = []
+    current: list[Mapping[str, Any]] = []
+    current_tokens = 0
+    for article in articles:
+        tokens = (len(article["content"] or "") + len(article["title"] or "")) // 4
+        over_budget = current_tokens + tokens > max_prompt_tokens
+        if current and (over_budget or len(current) >= max_batch_size):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(article)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
 
 
 def _strip_code_fences(raw: str) -> str:
@@ -203,63 +462,198 @@ def _strip_code_fences(raw: str) -> str:
     return text
 
 
-async def _run_and_parse(run: Callable[[], Coroutine[Any, Any, str]]) -> AnalysisResult:
+def _gemini_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _GEMINI_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _GEMINI_SEMAPHORES[loop] = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+    return semaphore
+
+
+def _cache_key(provider: str, model: str, prompt: str | bytes) -> bytes:
+    if isinstance(prompt, str):
+        prompt = prompt.encode()
+    digest = hashlib.blake2b(f"{provider}|{model}|".encode(), digest_size=16)
+    digest.update(prompt)
+    return digest.digest()
+
+
+async def _run_and_parse(
+    run: Callable[[], Coroutine[Any, Any, str]],
+    cache_key: bytes | None = None,
+    *,
+    strip_fences: bool = True,
+) -> AnalysisResult:
+    """
+    Run the provider call and validate its output.
+
+    `run` returns the raw JSON text (plain completions, streamed structured output and
+    accumulated tool input alike); fences are stripped first unless strip_fences is False.
+    """
+    if cache_key is not None:
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            _RESULT_CACHE.move_to_end(cache_key)
+            return cached.model_copy(deep=True)
+
     raw = await run()
-    cleaned = _strip_code_fences(raw)
     try:
-        return AnalysisResult.model_validate_json(cleaned)
+        cleaned = _strip_code_fences(raw) if strip_fences else raw
+        result = _ANALYSIS_ADAPTER.validate_json(cleaned.encode())
     except ValidationError as exc:
         logger.error("Failed to parse LLM response: %s", exc)
         raise
 
+    if cache_key is not None:
+        _RESULT_CACHE[cache_key] = result.model_copy(deep=True)
+        if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return result
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClaudeAnalyzer:
     api_key: str
     model: str = "claude-sonnet-4-5-20250929"
-    provider: str = "anthropic"
+    provider: str = PROVIDER_ANTHROPIC
+    base_url: str = ANTHROPIC_MESSAGES_URL
+    timeout: float = 60.0
+    _http_client: Optional[httpx.AsyncClient] = field(default=None, repr=False)
+
+    supports_youtube: ClassVar[bool] = False
 
     async def analyze(self, *, title: str, source: str | None, published_at: Any, content: str) -> AnalysisResult:
-        client = AsyncAnthropic(api_key=self.api_key)
-        prompt = _build_prompt(title, source, published_at, content, include_summary=True)
+        content = _truncate_for_budget(content, _CONTENT_BUDGETS[self.provider])
+        prompt = _build_prompt_json(title, source, published_at, content, include_summary=True)
+        body = b'{"model":' + orjson.dumps(self.model) + _CLAUDE_BODY_TAIL + prompt + b"}]}"
 
         async def run() -> str:
-            msg = await client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            return msg.content[0].text  # type: ignore[index]
-
-        return await _run_and_parse(run)
-
-
-@dataclass
+            # Forced tool use makes the API return the analysis as schema-shaped JSON input,
+            # streamed as partial JSON fragments that we join once at the end
+            client = self._http_client or get_http_client()
+            chunks: list[str] = []
+            async for data in _stream_sse(
+                client,
+                self.base_url,
+                body=body,
+                headers={
+                    "x-api-key": self.api_key,
+                    "anthropic-version": ANTHROPIC_VERSION,
+                    "Content-Type": "application/json",
+                },
+                timeout=self.timeout,
+            ):
+                event = orjson.loads(data)
+                event_type = event.get("type")
+                if event_type == "content_block_delta":
+                    delta = event.get("delta") or {}
+                    if delta.get("type") == "input_json_delta":
+                        chunks.append(delta.get("partial_json", ""))
+                elif event_type == "error":
+                    raise RuntimeError(f"Anthropic stream error: {event.get('error')}")
+            return "".join(chunks) or "{}"
+
+        cache_key = _cache_key(self.provider, self.model, body)
+        return await _run_and_parse(run, cache_key, strip_fences=False)
+
+
+@dataclass(slots=True, frozen=True)
 class OpenAIAnalyzer:
     api_key: str
     model: str = "gpt-4o"
-    provider: str = "openai"
+    provider: str = PROVIDER_OPENAI
+    base_url: str = OPENAI_CHAT_URL
+    timeout: float = 60.0
+    _http_client: Optional[httpx.AsyncClient] = field(default=None, repr=False)
+
+    supports_youtube: ClassVar[bool] = False
+
+    def _headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
 
     async def analyze(self, *, title: str, source: str | None, published_at: Any, content: str) -> AnalysisResult:
-        client = AsyncOpenAI(api_key=self.api_key)
-        prompt = _build_prompt(title, source, published_at, content, include_summary=False)
+        content = _truncate_for_budget(content, _CONTENT_BUDGETS[self.provider])
+        prompt = _build_prompt_json(title, source, published_at, content, include_summary=False)
+        body = b'{"model":' + orjson.dumps(self.model) + _OPENAI_BODY_TAIL + prompt + b"}]}"
 
         async def run() -> str:
-            resp = await client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=400,
+            client = self._http_client or get_http_client()
+            chunks: list[str] = []
+            async for data in _stream_sse(
+                client, self.base_url, body=body, headers=self._headers(), timeout=self.timeout
+            ):
+                choices = orjson.loads(data).get("choices") or []
+                if choices:
+                    text = (choices[0].get("delta") or {}).get("content")
+                    if text:
+                        chunks.append(text)
+            return "".join(chunks) or "{}"
+
+        cache_key = _cache_key(self.provider, self.model, body)
+        return await _run_and_parse(run, cache_key, strip_fences=False)
+
+    async def analyze_many(
+        self,
+        articles: Sequence[Mapping[str, Any]],
+        *,
+        max_batch_size: int = 8,
+        max_prompt_tokens: int = 60_000,
+    ) -> list[AnalysisResult]:
+        """
+        Analyze several articles with one request per batch to save on requests-per-minute.
+
+        Each article mapping needs title/source/published_at/content keys. Results are
+        returned in input order.
+        """
+        if not articles:
+            return []
+        client = self._http_client or get_http_client()
+        budget = _CONTENT_BUDGETS[self.provider]
+        articles = [
+            {**article, "content": _truncate_for_budget(article["content"] or "", budget)}
+            for article in articles
+        ]
+
+        async def run_batch(batch: list[Mapping[str, Any]]) -> list[AnalysisResult]:
+            body = orjson.dumps(
+                {
+                    "model": self.model,
+                    "max_tokens": 400 * len(batch),
+                    "response_format": _OPENAI_BATCH_FORMAT,
+                    "messages": [{"role": "user", "content": _build_batch_prompt(batch)}],
+                }
             )
-            return resp.choices[0].message.content or "{}"
-
-        return await _run_and_parse(run)
-
-
-@dataclass
+            resp = await client.post(
+                self.base_url, content=body, headers=self._headers(), timeout=self.timeout
+            )
+            resp.raise_for_status()
+            message = orjson.loads(resp.content)["choices"][0]["message"]
+            items = orjson.loads(message.get("content") or "{}").get("analyses") or []
+            if len(items) != len(batch):
+                raise ValueError(
+                    f"Expected {len(batch)} analyses in batch response, got {len(items)}"
+                )
+            try:
+                return [_ANALYSIS_ADAPTER.validate_python(item) for item in items]
+            except ValidationError as exc:
+                logger.error("Failed to parse batched LLM response: %s", exc)
+                raise
+
+        batches = _chunk_for_context(articles, max_prompt_tokens, max_batch_size)
+        results = await asyncio.gather(*(run_batch(batch) for batch in batches))
+        return [res for batch_results in results for res in batch_results]
+
+
+@dataclass(slots=True, frozen=True)
 class GeminiAnalyzer:
     api_key: str
     model: str = "gemini-2.5-pro"
-    provider: str = "google"
+    provider: str = PROVIDER_GOOGLE
+    base_url: str = GEMINI_BASE_URL
+    timeout: float = 120.0
+    _http_client: Optional[httpx.AsyncClient] = field(default=None, repr=False)
+
+    supports_youtube: ClassVar[bool] = True
 
     async def analyze(
         self,
@@ -270,29 +664,73 @@ class GeminiAnalyzer:
         content: str,
         youtube_url: str | None = None,
     ) -> AnalysisResult:
-        genai.configure(api_key=self.api_key)
+        if youtube_url:
+            # Use multimodal: Gemini watches the YouTube video
+            prompt = _build_youtube_prompt_json(title, source, published_at, include_summary=False)
+            body = (
+                b'{"contents":[{"parts":[{"file_data":{"file_uri":'
+                + orjson.dumps(youtube_url)
+                + b'}},{"text":'
+                + prompt
+                + b"}]}]}"
+            )
+        else:
+            content = _truncate_for_budget(content, _CONTENT_BUDGETS[self.provider])
+            prompt = _build_prompt_json(title, source, published_at, content, include_summary=False)
+            body = b'{"contents":[{"parts":[{"text":' + prompt + b"}]}]}"
 
         async def run() -> str:
-            # google-generativeai does not expose async; run in a thread
-            loop = asyncio.get_running_loop()
-
-            def _sync_call() -> str:
-                model = genai.GenerativeModel(self.model)
-                if youtube_url:
-                    # Use multimodal: Gemini watches the YouTube video
-                    prompt = _build_youtube_prompt(title, source, published_at, include_summary=False)
-                    resp = model.generate_content([
-                        {"file_data": {"file_uri": youtube_url}},
-                        prompt,
-                    ])
-                else:
-                    prompt = _build_prompt(title, source, published_at, content, include_summary=False)
-                    resp = model.generate_content(prompt)
-                return resp.text or "{}"
-
-            return await loop.run_in_executor(None, _sync_call)
-
-        return await _run_and_parse(run)
+            # Call the REST endpoint directly on the pooled client (the SDK is sync-only)
+            client = self._http_client or get_http_client()
+            waited_from = time.perf_counter()
+            async with _gemini_semaphore():
+                waited = time.perf_counter() - waited_from
+                if waited > _GEMINI_SLOW_ACQUIRE_SECONDS:
+                    logger.warning("Gemini concurrency saturated; waited %.2fs for a slot", waited)
+                chunks: list[str] = []
+                async for data in _stream_sse(
+                    client,
+                    f"{self.base_url}/{self.model}:streamGenerateContent",
+                    body=body,
+                    headers={"x-goog-api-key": self.api_key, "Content-Type": "application/json"},
+                    params={"alt": "sse"},
+                    timeout=self.timeout,
+                ):
+                    chunks.append(_extract_gemini_text(orjson.loads(data)))
+            return "".join(chunks) or "{}"
+
+        return await _run_and_parse(run, _cache_key(self.provider, self.model, body))
+
+
+async def _stream_sse(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    body: bytes,
+    headers: dict[str, str],
+    timeout: float,
+    params: dict[str, str] | None = None,
+) -> AsyncIterator[str]:
+    """POST a request body and yield the payload of each server-sent `data:` line."""
+    async with client.stream(
+        "POST", url, content=body, headers=headers, params=params, timeout=timeout
+    ) as resp:
+        resp.raise_for_status()
+        async for line in resp.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data and data != "[DONE]":
+                yield data
+
+
+def _extract_gemini_text(data: dict[str, Any]) -> str:
+    """Join the text parts of the first Gemini candidate."""
+    candidates = data.get("candidates") or []
+    if not candidates:
+        return ""
+    parts = (candidates[0].get("content") or {}).get("parts") or []
+    return "".join(part.get("text", "") for part in parts)
 
 
 async def run_all_analyzers(
@@ -304,22 +742,31 @@ async def run_all_analyzers(
     content: str,
     youtube_url: str | None = None,
 ) -> list[tuple[str, str, AnalysisResult]]:
-    tasks = []
-    for analyzer in analyzers:
-        provider = getattr(analyzer, "provider", "unknown")
-        model_name = getattr(analyzer, "model", "auto")
-        # Pass youtube_url only to Gemini (it supports video analysis)
-        if provider == "google" and youtube_url:
-            coro = analyzer.analyze(
-                title=title, source=source, published_at=published_at, content=content, youtube_url=youtube_url
-            )
-        else:
-            coro = analyzer.analyze(title=title, source=source, published_at=published_at, content=content)
-        tasks.append(_wrap_with_provider(provider, model_name, coro))
-    return await asyncio.gather(*tasks)
-
-
-async def _wrap_with_provider(provider: str, model: str, coro: Coroutine[Any, Any, AnalysisResult]) -> tuple[str, str, AnalysisResult]:
-    res = await coro
-    return provider, model, res
+    base_kwargs = {
+        "title": title,
+        "source": source,
+        "published_at": published_at,
+        "content": content,
+    }
+    # Only analyzers that can watch video (Gemini) receive the YouTube URL
+    youtube_kwargs = {**base_kwargs, "youtube_url": youtube_url} if youtube_url else base_kwargs
+
+    calls = [
+        (analyzer, youtube_kwargs if analyzer.supports_youtube else base_kwargs)
+        for analyzer in analyzers
+    ]
 
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                (analyzer.provider, analyzer.model, tg.create_task(analyzer.analyze(**kwargs)))
+                for analyzer, kwargs in calls
+            ]
+    except ExceptionGroup as group:
+        # Surface the provider error itself, as gather did, rather than "unhandled errors in a
+        # TaskGroup"; any further failures are logged so they aren't lost
+        first, *others = group.exceptions
+        for other in others:
+            logger.error("Additional analyzer failure: %s", other, exc_info=other)
+        raise first from None
+    return [(provider, model, task.result()) for provider, model, task in tasks]
@@ -9,10 +9,12 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "https://api.firecrawl.dev/v1/scrape"
+DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=10)
 
 
 @dataclass
@@ -21,13 +23,33 @@ class FirecrawlClient:
     base_url: str = DEFAULT_BASE_URL
     timeout: float = 20.0
     _http_client: Optional[httpx.AsyncClient] = field(default=None, repr=False)
+    _owned_client: Optional[httpx.AsyncClient] = field(default=None, init=False, repr=False)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the injected client, or a lazily created one kept alive across scrapes."""
+        if self._http_client is not None:
+            return self._http_client
+        if self._owned_client is None or self._owned_client.is_closed:
+            # Auth lives on the owned client so each scrape doesn't rebuild the header
+            self._owned_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=DEFAULT_LIMITS,
+                http2=True,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+        return self._owned_client
+
+    async def close(self) -> None:
+        """Close the client this instance created (an injected client is left to its owner)."""
+        if self._owned_client is not None:
+            await self._owned_client.aclose()
+            self._owned_client = None
 
     async def scrape(self, url: str) -> Optional[str]:
         """
         Scrape the given URL and return the content/body text.
         """
 
-        headers = {"Authorization": f"Bearer {self.api_key}"}
         payload: dict[str, Any] = {
             "url": url,
             "formats": ["markdown"],
@@ -35,16 +57,14 @@ class FirecrawlClient:
             "onlyMainContent": True,  # Strip nav/footer/ads
         }
 
-        # Use shared client if available, otherwise create a temporary one
+        # An injected client is shared with other services, so it gets the auth header per request
+        headers = None
         if self._http_client is not None:
-            resp = await self._http_client.post(self.base_url, json=payload, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-        else:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.post(self.base_url, json=payload, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
+            headers = {"Authorization": f"Bearer {self.api_key}"}
+        resp = await self._get_client().post(self.base_url, json=payload, headers=headers)
+        resp.raise_for_status()
+        # Markdown bodies run to hundreds of KB; orjson decodes them far faster than stdlib json
+        data = orjson.loads(resp.content)
 
         # Firecrawl v1 nests content under data.data
         inner = data.get("data", {})
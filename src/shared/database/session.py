@@ -5,35 +5,86 @@ Async SQLAlchemy engine and session management helpers.
 from __future__ import annotations
 
 import logging
-from typing import AsyncIterator
+from functools import lru_cache
+from typing import Any, AsyncIterator, Literal
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from shared.config import Settings, get_settings
 from shared.database.models import Base
 
 logger = logging.getLogger(__name__)
 
-
-def create_engine_from_settings(settings: Settings | None = None) -> AsyncEngine:
+PoolMode = Literal["null", "small", "default"]
+
+# "null": no pooling, for hosts that run each request on a fresh event loop (Flask async views).
+# "small": one warm connection plus brief overflow, recycled instead of pinged; suits Functions.
+# "default": SQLAlchemy's standard pool with pre-ping, for long-running workers.
+_POOL_OPTIONS: dict[str, dict[str, Any]] = {
+    "null": {"poolclass": NullPool},
+    "small": {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": 1,
+        "max_overflow": 2,
+        "pool_recycle": 300,
+        "pool_pre_ping": False,
+    },
+    "default": {"pool_pre_ping": True},
+}
+
+
+def create_engine_from_settings(
+    settings: Settings | None = None,
+    *,
+    pool_mode: PoolMode = "small",
+) -> AsyncEngine:
     """
     Create an async engine using the provided settings or default environment settings.
     """
 
     settings = settings or get_settings()
-    logger.debug("Creating async engine for %s", settings.DATABASE_URL)
-    return create_async_engine(settings.DATABASE_URL, echo=False, pool_pre_ping=True, future=True)
+    logger.debug("Creating async engine (pool_mode=%s) for %s", pool_mode, settings.DATABASE_URL)
+    return create_async_engine(
+        settings.DATABASE_URL, echo=False, future=True, **_POOL_OPTIONS[pool_mode]
+    )
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """
+    Process-wide engine built from the default settings on first use.
+    """
+
+    return create_engine_from_settings()
+
+
+@lru_cache(maxsize=1)
+def _default_session_maker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=get_engine(), expire_on_commit=False)
 
 
 def get_session_maker(engine: AsyncEngine | None = None) -> async_sessionmaker[AsyncSession]:
     """
-    Return an async session factory bound to the provided engine (or default engine).
+    Return an async session factory bound to the provided engine (or the cached default engine).
     """
 
-    engine = engine or create_engine_from_settings()
+    if engine is None:
+        return _default_session_maker()
     return async_sessionmaker(bind=engine, expire_on_commit=False)
 
 
+async def dispose_engine() -> None:
+    """
+    Close the cached default engine's connections; the next get_engine() call builds a new one.
+    """
+
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+    _default_session_maker.cache_clear()
+    get_engine.cache_clear()
+
+
 async def get_session(engine: AsyncEngine | None = None) -> AsyncIterator[AsyncSession]:
     """
     Context-managed async session generator.
@@ -2,18 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 from collections import Counter
-from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Sequence
 
 import httpx
+import orjson
 
-if TYPE_CHECKING:
-    from ..config import Settings
+from ..config import get_runtime_cfg
 
 logger = logging.getLogger(__name__)
 
+# Webhook calls come in bursts to a single host, so a small persistent pool is plenty
+_WEBHOOK_TIMEOUT = 30.0
+_WEBHOOK_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Webhooks allow ~30 requests/minute per channel; keep fan-out modest and honour 429s
+ALERT_CONCURRENCY = 5
+_RATE_LIMIT_RETRIES = 3
+_MAX_RETRY_AFTER = 60.0
+
+# Static webhook identity, merged into every payload
+_AVATAR_URL = "https://cdn-icons-png.flaticon.com/512/2593/2593635.png"
+_ALERT_PAYLOAD_BASE = {"username": "MarketNews Bot", "avatar_url": _AVATAR_URL}
+_DIGEST_PAYLOAD_BASE = {"username": "MarketNews Digest", "avatar_url": _AVATAR_URL}
+
 
 class DiscordColor:
     """Discord embed color codes."""
@@ -23,6 +41,59 @@ class DiscordColor:
     INFO = 0x3B82F6     # Blue
 
 
+# Keyed by lowercased sentiment; anything else renders as neutral
+_SENT_COLOR = {"bullish": DiscordColor.BULLISH, "bearish": DiscordColor.BEARISH}
+_SENT_EMOJI = {"bullish": "🟢", "bearish": "🔴"}
+_NEUTRAL_EMOJI = "🟡"
+
+# One digest row; filled per article with format_map
+_DIGEST_FIELD_TMPL = (
+    "{emoji} **{sentiment}** ({sentiment_score:+.2f}) | Impact: {bar} {impact:.2f}\n"
+    "*{source}* • {published}\n"
+    "[Read Article]({url})"
+)
+_DIGEST_TITLE_MAX = 100
+
+# Every impact bar for the widths we render (alerts use 10, digest rows use 5)
+_BARS = {width: tuple("█" * i + "░" * (width - i) for i in range(width + 1)) for width in (5, 10)}
+
+
+def count_sentiments(analyses: list[dict]) -> Counter[str]:
+    """Tally lowercased sentiments across analyses, skipping any without one."""
+    return Counter(
+        str(sentiment).lower() for a in analyses if (sentiment := a.get("sentiment")) is not None
+    )
+
+
+def _embed_timestamp() -> str:
+    """Current UTC time in the ISO-8601 form Discord expects for embed timestamps."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@lru_cache(maxsize=256)
+def _model_label(provider: Optional[str], model_name: Optional[str]) -> str:
+    """Human-friendly model/provider label."""
+    provider_lower = (provider or "").lower()
+    if provider_lower == "anthropic":
+        return "Claude Sonnet 4.5"
+    if provider_lower == "openai":
+        base = "ChatGPT"
+    elif provider_lower == "google":
+        base = "Gemini"
+    else:
+        base = (provider or "Analysis").title()
+    
+    if model_name:
+        return f"{base} ({model_name})"
+    return base
+
+
+@lru_cache(maxsize=256)
+def _wall_clock_label(wall_clock: datetime) -> str:
+    # Keyed on naive wall-clock time: aware datetimes hash by instant, so two zones would collide
+    return wall_clock.strftime("%b %d, %Y %I:%M %p ET")
+
+
 class DiscordNotifier:
     """Service for sending Discord notifications via webhooks."""
     
@@ -36,8 +107,8 @@ class DiscordNotifier:
         """
         Initialize the Discord notifier.
         
-        If parameters are not provided, they will be loaded from settings.
-        This allows for both eager (from settings) and explicit initialization.
+        Parameters that are not provided fall back to the cached runtime settings
+        on each access. This allows for both eager (from settings) and explicit initialization.
         
         Args:
             alerts_webhook: Discord webhook URL for alerts (optional)
@@ -49,39 +120,43 @@ class DiscordNotifier:
         self._digests_webhook = digests_webhook
         self._impact_threshold = impact_threshold
         self._http_client = http_client
-        self._settings_loaded = False
+        self._owned_client: Optional[httpx.AsyncClient] = None
+        self._pending: set[asyncio.Task[bool]] = set()
     
-    def _ensure_settings(self) -> None:
-        """Lazily load settings if not already provided."""
-        if self._settings_loaded:
-            return
-        
-        from ..config import get_settings
-        settings = get_settings()
-        
-        if self._alerts_webhook is None:
-            self._alerts_webhook = settings.DISCORD_WEBHOOK_ALERTS
-        if self._digests_webhook is None:
-            self._digests_webhook = settings.DISCORD_WEBHOOK_DIGESTS
-        if self._impact_threshold is None:
-            self._impact_threshold = settings.IMPACT_THRESHOLD
-        
-        self._settings_loaded = True
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the injected client, or a lazily created one kept alive across sends."""
+        if self._http_client is not None:
+            return self._http_client
+        if self._owned_client is None or self._owned_client.is_closed:
+            self._owned_client = httpx.AsyncClient(
+                timeout=_WEBHOOK_TIMEOUT, limits=_WEBHOOK_LIMITS, http2=True
+            )
+        return self._owned_client
+    
+    async def close(self) -> None:
+        """Close the client this notifier created (an injected client is left to its owner)."""
+        if self._owned_client is not None:
+            await self._owned_client.aclose()
+            self._owned_client = None
     
     @property
     def alerts_webhook(self) -> Optional[str]:
-        self._ensure_settings()
-        return self._alerts_webhook
+        if self._alerts_webhook is not None:
+            return self._alerts_webhook
+        return get_runtime_cfg().discord_alerts
     
     @property
     def digests_webhook(self) -> Optional[str]:
-        self._ensure_settings()
-        return self._digests_webhook
+        if self._digests_webhook is not None:
+            return self._digests_webhook
+        return get_runtime_cfg().discord_digests
     
     @property
     def impact_threshold(self) -> float:
-        self._ensure_settings()
-        return self._impact_threshold or 0.75
+        threshold = self._impact_threshold
+        if threshold is None:
+            threshold = get_runtime_cfg().impact_threshold
+        return threshold or 0.75
         
     async def send_article_alert(
         self,
@@ -94,7 +169,8 @@ class DiscordNotifier:
         avg_sentiment_score: float,
         avg_impact_score: float,
         analyses: list[dict],
-        key_topics: list[str]
+        key_topics: list[str],
+        sentiment_counts: Optional[Counter[str]] = None,
     ) -> bool:
         """
         Send high-impact article alert to Discord.
@@ -110,23 +186,27 @@ class DiscordNotifier:
             avg_impact_score: Average impact score (0 to 1)
             analyses: List of analysis dicts from all LLMs
             key_topics: Combined key topics from all analyses
+            sentiment_counts: Precomputed count_sentiments(analyses), if the caller has it
             
         Returns:
             True if sent successfully, False otherwise
         """
         try:
-            # Determine embed color based on sentiment
-            color = self._get_sentiment_color(sentiment)
+            # Determine embed color and emoji based on sentiment
+            sentiment_key = sentiment.lower()
+            color = _SENT_COLOR.get(sentiment_key, DiscordColor.NEUTRAL)
             
             # Format sentiment score display
-            sentiment_emoji = self._get_sentiment_emoji(sentiment)
+            sentiment_emoji = _SENT_EMOJI.get(sentiment_key, _NEUTRAL_EMOJI)
             score_display = f"{sentiment_emoji} **{sentiment}** ({avg_sentiment_score:+.2f})"
             
             # Format impact display with bar
             impact_display = self._format_impact_bar(avg_impact_score)
             
             # Build embed
-            footer_text = self._build_sentiment_footer(analyses, sentiment, article_id)
+            footer_text = self._build_sentiment_footer(
+                analyses, sentiment, article_id, sentiment_counts=sentiment_counts
+            )
 
             embed = {
                 "title": f"🚨 High-Impact Alert: {title}",
@@ -153,7 +233,7 @@ class DiscordNotifier:
                 "footer": {
                     "text": footer_text
                 },
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _embed_timestamp()
             }
             
             # Add model-level sentiment breakdown as inline fields (horizontal layout)
@@ -177,20 +257,9 @@ class DiscordNotifier:
             })
             
             # Send webhook
-            payload = {
-                "embeds": [embed],
-                "username": "MarketNews Bot",
-                "avatar_url": "https://cdn-icons-png.flaticon.com/512/2593/2593635.png"
-            }
+            payload = {"embeds": [embed], **_ALERT_PAYLOAD_BASE}
             
-            # Use shared client if available, otherwise create a temporary one
-            if self._http_client is not None:
-                response = await self._http_client.post(self.alerts_webhook, json=payload)
-                response.raise_for_status()
-            else:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(self.alerts_webhook, json=payload)
-                    response.raise_for_status()
+            await self._post_webhook(self.alerts_webhook, payload)
                 
             logger.info(f"Sent Discord alert for article {article_id}: {title}")
             return True
@@ -199,6 +268,69 @@ class DiscordNotifier:
             logger.error(f"Failed to send Discord alert for article {article_id}: {e}", exc_info=True)
             return False
     
+    def fire_and_forget_alert(self, **kwargs: Any) -> asyncio.Task[bool]:
+        """
+        Schedule send_article_alert in the background and return its task.
+        
+        The task is tracked until it finishes; await drain() before the event loop
+        or host may stop so in-flight alerts are not lost.
+        """
+        task = asyncio.create_task(self.send_article_alert(**kwargs))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+    
+    async def drain(self) -> None:
+        """Wait for every background alert scheduled by fire_and_forget_alert."""
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+    
+    async def send_article_alerts(
+        self,
+        jobs: Sequence[Mapping[str, Any]],
+        *,
+        concurrency: int = ALERT_CONCURRENCY,
+    ) -> list[bool]:
+        """
+        Send several article alerts concurrently, at most `concurrency` in flight.
+        
+        Args:
+            jobs: Keyword arguments for send_article_alert, one mapping per alert
+            concurrency: Maximum simultaneous webhook requests
+            
+        Returns:
+            One success flag per job, in order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _send_one(job: Mapping[str, Any]) -> bool:
+            async with semaphore:
+                return await self.send_article_alert(**job)
+        
+        return list(await asyncio.gather(*(_send_one(job) for job in jobs)))
+    
+    async def _post_webhook(self, url: Optional[str], payload: dict) -> httpx.Response:
+        """POST a JSON payload, sleeping out Discord 429s per Retry-After before giving up."""
+        body = orjson.dumps(payload)
+        client = self._get_client()
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            response = await client.post(url, content=body, headers=_JSON_HEADERS)
+            if response.status_code != 429 or attempt == _RATE_LIMIT_RETRIES:
+                break
+            delay = self._retry_after_seconds(response)
+            logger.warning("Discord rate limited; retrying in %.2fs", delay)
+            await asyncio.sleep(delay)
+        response.raise_for_status()
+        return response
+    
+    @staticmethod
+    def _retry_after_seconds(response: httpx.Response) -> float:
+        try:
+            delay = float(response.headers.get("Retry-After", 1.0))
+        except ValueError:
+            delay = 1.0
+        return min(max(delay, 0.0), _MAX_RETRY_AFTER)
+    
     async def send_digest(
         self,
         digest_type: str,
@@ -219,6 +351,7 @@ class DiscordNotifier:
             Discord message ID if sent successfully, None otherwise
         """
         try:
+            now_iso = _embed_timestamp()
             if not articles:
                 # Send empty digest message
                 embed = {
@@ -226,7 +359,7 @@ class DiscordNotifier:
                     "description": f"No significant market news during this period.\n\n"
                                  f"**Period:** {self._format_timestamp(period_start)} - {self._format_timestamp(period_end)}",
                     "color": DiscordColor.INFO,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now_iso
                 }
             else:
                 # Build digest with ranked articles
@@ -241,23 +374,29 @@ class DiscordNotifier:
                     "description": description,
                     "color": DiscordColor.INFO,
                     "fields": [],
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now_iso
                 }
                 
                 # Add top articles (limit to 10 for Discord embed limits)
                 for i, article in enumerate(articles[:10], 1):
-                    sentiment_emoji = self._get_sentiment_emoji(article["sentiment"])
-                    impact_bar = self._format_impact_bar(article["avg_impact_score"], width=5)
+                    impact = article["avg_impact_score"]
+                    field_value = _DIGEST_FIELD_TMPL.format_map({
+                        "emoji": self._get_sentiment_emoji(article["sentiment"]),
+                        "sentiment": article["sentiment"],
+                        "sentiment_score": article["avg_sentiment_score"],
+                        "bar": self._format_impact_bar(impact, width=5),
+                        "impact": impact,
+                        "source": article["source"],
+                        "published": self._format_timestamp(article["published_at"]),
+                        "url": article["news_url"],
+                    })
                     
-                    field_value = (
-                        f"{sentiment_emoji} **{article['sentiment']}** ({article['avg_sentiment_score']:+.2f}) | "
-                        f"Impact: {impact_bar} {article['avg_impact_score']:.2f}\n"
-                        f"*{article['source']}* • {self._format_timestamp(article['published_at'])}\n"
-                        f"[Read Article]({article['news_url']})"
-                    )
+                    title = article["title"]
+                    if len(title) > _DIGEST_TITLE_MAX:
+                        title = title[:_DIGEST_TITLE_MAX] + "..."
                     
                     embed["fields"].append({
-                        "name": f"{i}. {article['title'][:100]}{'...' if len(article['title']) > 100 else ''}",
+                        "name": f"{i}. {title}",
                         "value": field_value,
                         "inline": False
                     })
@@ -268,20 +407,9 @@ class DiscordNotifier:
                     }
             
             # Send to digests webhook
-            payload = {
-                "embeds": [embed],
-                "username": "MarketNews Digest",
-                "avatar_url": "https://cdn-icons-png.flaticon.com/512/2593/2593635.png"
-            }
+            payload = {"embeds": [embed], **_DIGEST_PAYLOAD_BASE}
             
-            # Use shared client if available, otherwise create a temporary one
-            if self._http_client is not None:
-                response = await self._http_client.post(self.digests_webhook, json=payload)
-            else:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(self.digests_webhook, json=payload)
-
-            response.raise_for_status()
+            response = await self._post_webhook(self.digests_webhook, payload)
             message_id = self._parse_message_id(response)
                 
             logger.info(f"Sent {digest_type} digest with {len(articles)} articles")
@@ -300,7 +428,7 @@ class DiscordNotifier:
         if response.status_code == 204 or not response.content:
             return None
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             if isinstance(data, dict):
                 return data.get("id")
         except Exception:
@@ -311,7 +439,8 @@ class DiscordNotifier:
         self,
         analyses: list[dict],
         sentiment: str,
-        avg_impact_score: float
+        avg_impact_score: float,
+        sentiment_counts: Optional[Counter[str]] = None,
     ) -> bool:
         """
         Determine if an article should trigger an alert.
@@ -327,6 +456,7 @@ class DiscordNotifier:
             analyses: List of analysis dicts
             sentiment: Consensus sentiment
             avg_impact_score: Average impact score
+            sentiment_counts: Precomputed count_sentiments(analyses), if the caller has it
             
         Returns:
             True if alert should be sent
@@ -334,33 +464,38 @@ class DiscordNotifier:
         if not analyses:
             return False
 
-        # Impact: all analyses must meet threshold
-        impacts = []
+        # Same tally whether or not the caller precomputed it, so the gate can't drift
+        counts = count_sentiments(analyses) if sentiment_counts is None else sentiment_counts
+        min_impact = math.inf
         for a in analyses:
             try:
-                impacts.append(float(a.get("impact_score", 0)))
+                impact = float(a.get("impact_score", 0))
             except (TypeError, ValueError):
-                impacts.append(0.0)
-        if not impacts or min(impacts) < self.impact_threshold:
+                impact = 0.0
+            if impact < min_impact:
+                min_impact = impact
+
+        # Impact: all analyses must meet threshold
+        if min_impact < self.impact_threshold:
             logger.info(
                 "Alert rejected: impact threshold not met (min=%.2f, threshold=%.2f)",
-                min(impacts) if impacts else 0.0,
+                min_impact,
                 self.impact_threshold,
             )
             return False
 
         # Sentiment majority, allow one disagree; reject if all neutral; reject if 2/3 neutral (for 3-model cases)
-        sentiments = [str(a.get("sentiment", "")).lower() for a in analyses]
-        if sentiments and all(s == "neutral" for s in sentiments):
+        total = counts.total()
+        neutral = counts["neutral"]
+        if neutral == total:
             logger.info("Alert rejected: all sentiments neutral.")
             return False
-        if len(sentiments) == 3 and sentiments.count("neutral") >= 2:
+        if total == 3 and neutral >= 2:
             logger.info("Alert rejected: 2 of 3 sentiments are neutral.")
             return False
 
-        counts = Counter(sentiments)
         leader, leader_count = counts.most_common(1)[0]
-        needed = (len(sentiments) + 1) // 2  # simple majority (ceil(n/2))
+        needed = (total + 1) // 2  # simple majority (ceil(n/2))
         has_majority = leader_count >= needed
 
         if not has_majority:
@@ -374,8 +509,8 @@ class DiscordNotifier:
             "Alert criteria met: majority=%s (%s/%s), min_impact=%.2f >= %.2f",
             leader,
             leader_count,
-            len(sentiments),
-            min(impacts),
+            total,
+            min_impact,
             self.impact_threshold,
         )
         return True
@@ -439,27 +574,19 @@ class DiscordNotifier:
     
     def _format_model_label(self, provider: Optional[str], model_name: Optional[str]) -> str:
         """Human-friendly model/provider label."""
-        provider_lower = (provider or "").lower()
-        if provider_lower == "anthropic":
-            return "Claude Sonnet 4.5"
-        if provider_lower == "openai":
-            base = "ChatGPT"
-        elif provider_lower == "google":
-            base = "Gemini"
-        else:
-            base = (provider or "Analysis").title()
-        
-        if model_name:
-            return f"{base} ({model_name})"
-        return base
+        return _model_label(provider, model_name)
     
-    def _build_sentiment_footer(self, analyses: list[dict], consensus_sentiment: str, article_id: int) -> str:
+    def _build_sentiment_footer(
+        self,
+        analyses: list[dict],
+        consensus_sentiment: str,
+        article_id: int,
+        sentiment_counts: Optional[Counter[str]] = None,
+    ) -> str:
         """Build footer text that accurately reflects sentiment agreement/disagreement."""
-        sentiments = [str(a.get("sentiment", "")).lower() for a in analyses if a.get("sentiment") is not None]
-        counts = Counter(sentiments)
-        unique = set(sentiments)
+        counts = count_sentiments(analyses) if sentiment_counts is None else sentiment_counts
         
-        if len(unique) == 1 and sentiments:
+        if len(counts) == 1:
             return f"Article ID: {article_id} • All 3 LLMs agree on {consensus_sentiment.lower()} sentiment"
         
         # Build mixed summary e.g., "bearish 2, neutral 1"
@@ -467,36 +594,22 @@ class DiscordNotifier:
         breakdown = ", ".join(parts) if parts else "no sentiments"
         return f"Article ID: {article_id} • No consensus across LLMs ({breakdown})"
     
-    def _get_sentiment_color(self, sentiment: str) -> int:
-        """Get Discord color code for sentiment."""
-        sentiment_lower = sentiment.lower()
-        if sentiment_lower == "bullish":
-            return DiscordColor.BULLISH
-        elif sentiment_lower == "bearish":
-            return DiscordColor.BEARISH
-        else:
-            return DiscordColor.NEUTRAL
-    
     def _get_sentiment_emoji(self, sentiment: str) -> str:
         """Get colored dot emoji for sentiment."""
-        sentiment_lower = sentiment.lower()
-        if sentiment_lower == "bullish":
-            return "🟢"
-        elif sentiment_lower == "bearish":
-            return "🔴"
-        else:
-            return "🟡"
+        return _SENT_EMOJI.get(sentiment.lower(), _NEUTRAL_EMOJI)
     
     def _format_impact_bar(self, score: float, width: int = 10) -> str:
         """Format impact score as visual bar."""
-        filled = int(score * width)
-        empty = width - filled
-        return "█" * filled + "░" * empty
+        filled = max(0, min(width, int(score * width)))
+        bars = _BARS.get(width)
+        if bars is not None:
+            return bars[filled]
+        return "█" * filled + "░" * (width - filled)
     
     def _format_timestamp(self, dt: datetime) -> str:
         """Format timestamp for display."""
         if dt:
-            return dt.strftime("%b %d, %Y %I:%M %p ET")
+            return _wall_clock_label(dt.replace(tzinfo=None))
         return "Unknown"
 
 
@@ -527,18 +640,15 @@ def get_discord_notifier(
     return _discord_notifier
 
 
-# Backward compatibility: create instance on first access via property
-# This allows existing code using `discord_notifier` to continue working
-class _LazyDiscordNotifier:
-    """Lazy proxy for backward compatibility with direct discord_notifier imports."""
-    
-    _instance: Optional[DiscordNotifier] = None
+def __getattr__(name: str) -> DiscordNotifier:
+    """
+    Resolve the backward-compatible `discord_notifier` export on first access (PEP 562).
     
-    def __getattr__(self, name):
-        if self._instance is None:
-            self._instance = get_discord_notifier()
-        return getattr(self._instance, name)
-
-
-discord_notifier = _LazyDiscordNotifier()
-
+    The singleton is then bound as a real module global, so later lookups and
+    `from ... import discord_notifier` skip this hook entirely.
+    """
+    if name == "discord_notifier":
+        notifier = get_discord_notifier()
+        globals()["discord_notifier"] = notifier
+        return notifier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,9 @@ Shared HTTP client with connection pooling for improved performance.
 
 This module provides a singleton AsyncClient that can be reused across
 multiple service calls, enabling HTTP/2 connection reuse and proper
-connection pool management.
+connection pool management. HTTP/2 is on by default (h2 comes from the
+httpx[http2] extra), so concurrent calls to one host share a single TLS
+connection.
 
 Usage:
     from shared.services.http_client import get_http_client, close_http_client
@@ -12,13 +14,14 @@ Usage:
     client = get_http_client()
     response = await client.get("https://example.com")
 
-    # At application shutdown
+    # At application shutdown (sends GOAWAY on HTTP/2 connections)
     await close_http_client()
 """
 
 from __future__ import annotations
 
 import logging
+import os
 from typing import Optional
 
 import httpx
@@ -28,26 +31,60 @@ logger = logging.getLogger(__name__)
 # Global client instance (lazy initialized)
 _client: Optional[httpx.AsyncClient] = None
 
-# Default configuration - conservative limits suitable for Azure Functions
+# Open ManagedHttpClient scopes; the client may only be closed on release when this hits zero
+_refcount = 0
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+# Default configuration - sized for bursty fan-out (paged fetches + scrapes + LLM calls).
+# HTTP_MAX_CONNECTIONS / HTTP_KEEPALIVE_EXPIRY environment variables override these without a
+# code change. They're read straight from the environment so the client never depends on the
+# full application Settings (which require DATABASE_URL).
 DEFAULT_LIMITS = httpx.Limits(
-    max_keepalive_connections=20,
-    max_connections=100,
-    keepalive_expiry=30.0,  # Close idle connections after 30s
+    max_keepalive_connections=100,
+    max_connections=1000,
+    keepalive_expiry=75.0,  # Match common 75s server-side idle timeouts (e.g. nginx)
 )
 
 DEFAULT_TIMEOUT = httpx.Timeout(
     connect=10.0,   # Time to establish connection
     read=30.0,      # Time to read response
     write=30.0,     # Time to send request
-    pool=5.0,       # Time to acquire connection from pool
+    pool=30.0,      # Time to acquire connection from pool (generous to ride out bursts)
 )
 
 
+def _default_limits() -> httpx.Limits:
+    """DEFAULT_LIMITS with any overrides from the environment applied."""
+    max_connections = int(_env_override("HTTP_MAX_CONNECTIONS") or DEFAULT_LIMITS.max_connections)
+    return httpx.Limits(
+        max_keepalive_connections=min(DEFAULT_LIMITS.max_keepalive_connections, max_connections),
+        max_connections=max_connections,
+        keepalive_expiry=_env_override("HTTP_KEEPALIVE_EXPIRY") or DEFAULT_LIMITS.keepalive_expiry,
+    )
+
+
+def _env_override(name: str) -> float | None:
+    """Positive numeric override from the environment; unset or invalid values are ignored."""
+    raw = os.environ.get(name)
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning("Ignoring non-numeric %s=%r", name, raw)
+        return None
+    if value <= 0:
+        logger.warning("Ignoring non-positive %s=%r", name, raw)
+        return None
+    return value
+
+
 def get_http_client(
     *,
     limits: Optional[httpx.Limits] = None,
     timeout: Optional[httpx.Timeout] = None,
-    http2: bool = False,
+    http2: bool = True,
 ) -> httpx.AsyncClient:
     """
     Get the shared HTTP client instance.
@@ -56,9 +93,10 @@ def get_http_client(
     This enables connection pooling and HTTP/2 multiplexing for better performance.
 
     Args:
-        limits: Optional custom connection limits (only used on first call)
+        limits: Optional custom connection limits (only used on first call); defaults to
+            DEFAULT_LIMITS with settings overrides applied
         timeout: Optional custom timeout configuration (only used on first call)
-        http2: Enable HTTP/2 support (requires httpx[http2] package)
+        http2: Enable HTTP/2 support (only used on first call)
 
     Returns:
         The shared AsyncClient instance
@@ -66,14 +104,14 @@ def get_http_client(
     global _client
 
     if _client is None:
-        _limits = limits or DEFAULT_LIMITS
+        _limits = limits or _default_limits()
         _timeout = timeout or DEFAULT_TIMEOUT
 
         _client = httpx.AsyncClient(
             limits=_limits,
             timeout=_timeout,
             follow_redirects=True,
-            http2=http2,  # Enable HTTP/2 if package is installed
+            http2=http2,
         )
         logger.debug(
             "Initialized shared HTTP client with limits=%s, timeout=%s, http2=%s",
@@ -95,8 +133,9 @@ async def close_http_client() -> None:
     global _client
 
     if _client is not None:
-        await _client.aclose()
-        _client = None
+        # Detach before awaiting so callers during aclose() get a fresh client, not a closing one
+        client, _client = _client, None
+        await client.aclose()
         logger.debug("Closed shared HTTP client")
 
 
@@ -109,8 +148,9 @@ class ManagedHttpClient:
     """
     Context manager for the shared HTTP client.
 
-    This is useful for ensuring the client is properly closed at the end
-    of a scope, particularly in Azure Functions or test scenarios.
+    Open scopes are refcounted. When the last one exits and close_on_last_release
+    is set (defaults to the HTTP_CLOSE_ON_LAST_RELEASE environment variable), the
+    shared client is closed; otherwise it stays warm for the next invocation.
 
     Usage:
         async with ManagedHttpClient() as client:
@@ -122,16 +162,28 @@ class ManagedHttpClient:
         *,
         limits: Optional[httpx.Limits] = None,
         timeout: Optional[httpx.Timeout] = None,
+        close_on_last_release: Optional[bool] = None,
     ):
         self._limits = limits
         self._timeout = timeout
+        self._close_on_last_release = close_on_last_release
 
     async def __aenter__(self) -> httpx.AsyncClient:
-        return get_http_client(limits=self._limits, timeout=self._timeout)
+        global _refcount
+        client = get_http_client(limits=self._limits, timeout=self._timeout)
+        _refcount += 1
+        return client
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        # Note: We don't close the client here to allow reuse.
-        # Call close_http_client() explicitly when you're done with all requests.
-        pass
+        global _refcount
+        _refcount = max(_refcount - 1, 0)
+        if _refcount:
+            return
+
+        close = self._close_on_last_release
+        if close is None:
+            close = os.environ.get("HTTP_CLOSE_ON_LAST_RELEASE", "").lower() in _TRUTHY
+        if close:
+            await close_http_client()
 
 
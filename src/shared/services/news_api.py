@@ -4,22 +4,36 @@ StockNewsAPI client with paywall filtering and basic dedup helpers.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from functools import cached_property, lru_cache
 from typing import Any, Iterable, List, Optional
 
 import httpx
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from shared.services.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
 # Use the category endpoint per StockNewsAPI docs.
 DEFAULT_BASE_URL = "https://stocknewsapi.com/api/v1/category"
 
+# Pages requested at once by fetch_pages; they share the pooled HTTP/2 connection
+PAGE_CONCURRENCY = 8
+
+_PAYWALL_TOPICS = frozenset({"paywall", "paylimitwall"})
+# Most topics can be ruled out on length alone, before paying for .lower()
+_PAYWALL_TOPIC_LENGTHS = frozenset(len(topic) for topic in _PAYWALL_TOPICS)
+
 
 class NewsItem(BaseModel):
+    # The feed sends many more fields than we use; drop them without validating
+    model_config = ConfigDict(extra="ignore")
+
     news_url: str
     title: str
     text: str | None = None
@@ -28,30 +42,51 @@ class NewsItem(BaseModel):
     topics: list[str] = Field(default_factory=list)
     sentiment: str | None = None
 
+    @cached_property
     def published_at(self) -> Optional[datetime]:
         if not self.date:
             return None
-        date_str = self.date
-
-        # Try ISO8601 first (StockNewsAPI sometimes returns this)
-        try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except ValueError:
-            pass
+        return _parse_published(self.date)
+
+
+@lru_cache(maxsize=8192)
+def _parse_published(date_str: str) -> Optional[datetime]:
+    # The same timestamps repeat across pages and polls; datetimes are immutable so caching is safe.
+    # StockNewsAPI mostly returns RFC 2822 strings, e.g. "Mon, 08 Dec 2025 16:27:10 -0500", and
+    # sometimes ISO8601. Try the likely format first so the common case skips a failing parse.
+    if date_str[4:5] == "-":
+        parsers = (_parse_iso, _parse_rfc2822)
+    else:
+        parsers = (_parse_rfc2822, _parse_iso)
+    for parser in parsers:
+        parsed = parser(date_str)
+        if parsed is not None:
+            return parsed
+
+    logger.warning("Could not parse date %s", date_str)
+    return None
+
+
+def _parse_iso(date_str: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
 
-        # Fallback: StockNewsAPI also returns RFC 2822 strings, e.g. "Mon, 08 Dec 2025 16:27:10 -0500"
-        try:
-            parsed = parsedate_to_datetime(date_str)
-            if parsed:
-                return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
-        except (TypeError, ValueError):
-            pass
 
-        logger.warning("Could not parse date %s", self.date)
+def _parse_rfc2822(date_str: str) -> Optional[datetime]:
+    try:
+        parsed = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        return None
+    if not parsed:
         return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
 
 class NewsApiResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     data: list[NewsItem] = Field(default_factory=list)
     message: str | None = None
     total_pages: int | None = None
@@ -89,25 +124,46 @@ class StockNewsClient:
         if topicexclude:
             params["topicexclude"] = topicexclude
 
-        # Use shared client if available, otherwise create a temporary one
-        if self._http_client is not None:
-            response = await self._http_client.get(self.base_url, params=params)
-            response.raise_for_status()
-            payload = response.json()
-        else:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                payload = response.json()
+        # Always go through a pooled client so successive pages reuse one warm connection
+        client = self._http_client or get_http_client()
+        response = await client.get(self.base_url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        payload = response.json()
 
         try:
-            parsed = NewsApiResponse(**payload)
+            parsed = NewsApiResponse.model_validate(payload)
         except ValidationError as exc:
             logger.error("Failed to parse StockNewsAPI response: %s", exc)
             raise
 
         return parsed.data
 
+    async def fetch_pages(self, *, pages: int, **kwargs: Any) -> list[NewsItem]:
+        """
+        Fetch pages 1..pages concurrently and return their items in page order, deduplicated by URL.
+
+        Each page is a separate StockNewsAPI request and counts against the plan's quota, so
+        keep pages small. Keyword arguments are passed through to fetch_latest.
+        """
+
+        semaphore = asyncio.Semaphore(PAGE_CONCURRENCY)
+
+        async def _fetch(page: int) -> list[NewsItem]:
+            async with semaphore:
+                return await self.fetch_latest(page=page, **kwargs)
+
+        results = await asyncio.gather(*(_fetch(page) for page in range(1, pages + 1)))
+
+        items: list[NewsItem] = []
+        seen: set[str] = set()
+        for page_items in results:
+            for item in page_items:
+                if item.news_url in seen:
+                    continue
+                seen.add(item.news_url)
+                items.append(item)
+        return items
+
     def with_client(self, client: httpx.AsyncClient) -> "StockNewsClient":
         """Return a new instance using the provided HTTP client."""
         return StockNewsClient(
@@ -123,8 +179,7 @@ def is_paywalled(topics: Iterable[str]) -> bool:
     Determine if the article topics indicate a paywall.
     """
 
-    normalized = {t.lower() for t in topics}
-    return "paywall" in normalized or "paylimitwall" in normalized
+    return any(len(t) in _PAYWALL_TOPIC_LENGTHS and t.lower() in _PAYWALL_TOPICS for t in topics)
 
 
 def filter_new_articles(
@@ -134,19 +189,16 @@ def filter_new_articles(
     Filter out paywalled or duplicate articles by URL (existing in DB or within the same fetch).
     """
 
-    results: list[NewsItem] = []
-    seen_new: set[str] = set()
+    # URL -> first item seen; the dict both dedupes the batch and keeps feed order
+    results: dict[str, NewsItem] = {}
     for item in items:
-        if is_paywalled(item.topics):
-            logger.debug("Skipping paywalled article: %s", item.news_url)
-            continue
-        if item.news_url in existing_urls:
-            logger.debug("Skipping duplicate article: %s", item.news_url)
-            continue
-        if item.news_url in seen_new:
-            logger.debug("Skipping in-batch duplicate article: %s", item.news_url)
-            continue
-        seen_new.add(item.news_url)
-        results.append(item)
-    return results
-
+        url = item.news_url
+        if url in results:
+            logger.debug("Skipping in-batch duplicate article: %s", url)
+        elif url in existing_urls:
+            logger.debug("Skipping duplicate article: %s", url)
+        elif is_paywalled(item.topics):
+            logger.debug("Skipping paywalled article: %s", url)
+        else:
+            results[url] = item
+    return list(results.values())
@@ -4,11 +4,13 @@ Azure Storage Queue client wrapper for enqueueing messages.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Sequence
 
+import orjson
+from azure.core.exceptions import ResourceExistsError
 from azure.storage.queue.aio import QueueClient
 from azure.storage.queue import TextBase64EncodePolicy
 
@@ -23,37 +25,56 @@ class QueueService:
     queue_name: str
     create_queue: bool = True
     _client: QueueClient | None = None
+    _queue_ensured: bool = field(default=False, init=False, repr=False)
 
-    async def _get_client(self) -> QueueClient:
+    def __post_init__(self) -> None:
+        # Building the client does no I/O, so do it up front and keep sends branch-free
         if self._client is None:
             self._client = QueueClient.from_connection_string(
                 conn_str=self.connection_string,
                 queue_name=self.queue_name,
                 message_encode_policy=TextBase64EncodePolicy(),
             )
-            if self.create_queue:
-                try:
-                    await self._client.create_queue()
-                except Exception as exc:  # queue may already exist
-                    from azure.core.exceptions import ResourceExistsError
-
-                    if isinstance(exc, ResourceExistsError):
-                        logger.debug("Queue %s already exists; continuing.", self.queue_name)
-                    else:
-                        raise
-        return self._client
+
+    async def ensure_queue(self) -> None:
+        """
+        Create the queue if configured to and not already done by this instance.
+
+        Call before sending.
+        """
+        if self._queue_ensured or not self.create_queue:
+            return
+        try:
+            await self._client.create_queue()
+        except ResourceExistsError:
+            logger.debug("Queue %s already exists; continuing.", self.queue_name)
+        self._queue_ensured = True
 
     async def send_article_message(self, message: ArticleQueueMessage) -> None:
-        client = await self._get_client()
         payload = message.model_dump_json()
         logger.debug("Enqueueing message to %s: %s", self.queue_name, payload)
-        await client.send_message(payload)
+        await self._client.send_message(payload)
+
+    async def send_article_messages(
+        self, messages: Sequence[ArticleQueueMessage]
+    ) -> list[BaseException | None]:
+        """
+        Enqueue several article messages concurrently over the one queue client.
+
+        Returns one entry per message: None if it was sent, otherwise the exception raised.
+        """
+        send = self._client.send_message
+        payloads = [message.model_dump_json() for message in messages]
+        logger.debug("Enqueueing %s messages to %s", len(payloads), self.queue_name)
+        results = await asyncio.gather(
+            *(send(payload) for payload in payloads), return_exceptions=True
+        )
+        return [result if isinstance(result, BaseException) else None for result in results]
 
     async def send_raw(self, obj: Any) -> None:
-        client = await self._get_client()
-        payload = json.dumps(obj)
+        payload = orjson.dumps(obj).decode()
         logger.debug("Enqueueing raw message to %s: %s", self.queue_name, payload)
-        await client.send_message(payload)
+        await self._client.send_message(payload)
 
     async def close(self) -> None:
         if self._client:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import datetime, timezone
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from flask import Flask
 
@@ -12,6 +14,21 @@ from webapp.routes import register_blueprints
 
 logger = logging.getLogger(__name__)
 
+# Injected into every template render; read-only so the same mapping can be shared
+_APP_GLOBALS: Mapping[str, Any] = MappingProxyType(
+    {
+        "app_name": "Market News",
+        "sentiment_classes": MappingProxyType(
+            {
+                "bullish": "sentiment-bullish",
+                "bearish": "sentiment-bearish",
+                "neutral": "sentiment-neutral",
+                "mixed": "sentiment-mixed",
+            }
+        ),
+    }
+)
+
 
 def create_app() -> Flask:
     """
@@ -28,15 +45,13 @@ def create_app() -> Flask:
     )
     app.url_map.strict_slashes = False
 
-    engine = create_engine_from_settings(settings)
-    session_maker = get_session_maker(engine)
-
     app.config.update(
-        ENGINE=engine,
-        SESSION_MAKER=session_maker,
+        ENGINE=None,
+        SESSION_MAKER=None,
         SETTINGS=settings,
         PER_PAGE=20,
     )
+    _register_lazy_engine(app)
 
     register_blueprints(app)
     _register_template_filters(app)
@@ -44,6 +59,24 @@ def create_app() -> Flask:
     return app
 
 
+def _register_lazy_engine(app: Flask) -> None:
+    """
+    Build the engine and session maker on the first request rather than at import time.
+    """
+    lock = threading.Lock()
+
+    @app.before_request
+    def _ensure_engine() -> None:
+        if app.config["SESSION_MAKER"] is not None:
+            return
+        with lock:
+            if app.config["SESSION_MAKER"] is not None:
+                return
+            # Flask runs each async view on its own event loop, so pooled connections are unusable
+            engine = create_engine_from_settings(app.config["SETTINGS"], pool_mode="null")
+            app.config.update(ENGINE=engine, SESSION_MAKER=get_session_maker(engine))
+
+
 def _register_template_filters(app: Flask) -> None:
     @app.template_filter("format_datetime")
     def _format_datetime(value: datetime | None) -> str:
@@ -67,14 +100,5 @@ def _register_template_filters(app: Flask) -> None:
         return f"{value * 100:.0f}%"
 
     @app.context_processor
-    def inject_globals() -> dict[str, Any]:
-        return {
-            "app_name": "Market News",
-            "sentiment_classes": {
-                "bullish": "sentiment-bullish",
-                "bearish": "sentiment-bearish",
-                "neutral": "sentiment-neutral",
-                "mixed": "sentiment-mixed",
-            },
-        }
-
+    def inject_globals() -> Mapping[str, Any]:
+        return _APP_GLOBALS
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import math
+import time
 from typing import Any
 
 from flask import Blueprint, abort, current_app, render_template, request
-from sqlalchemy import and_, func, or_, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import and_, case, func, select, union
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
+from sqlalchemy.orm import noload, selectinload
 
 from shared.database.models import Article, ArticleAnalysis
 from webapp.utils import (
-    average,
-    collect_topics,
+    ArticleAggregates,
+    aggregates_from_rollup,
+    cached_aggregates,
     parse_date,
     sentiment_class,
-    sentiment_rollup,
     to_percent,
     to_float,
 )
@@ -26,6 +29,16 @@ IMPACT_LEVELS: dict[str, tuple[float, float]] = {
     "medium": (0.5, 0.75),
     "low": (0.0, 0.5),
 }
+_PROVIDER_ORDER = {"anthropic": 0, "openai": 1, "google": 2}
+# SQL twin of _analysis_sort_key so aggregated arrays come back in display order
+_ANALYSIS_SQL_ORDER = (
+    case(_PROVIDER_ORDER, value=func.lower(ArticleAnalysis.model_provider), else_=99),
+    ArticleAnalysis.model_name,
+)
+
+# The source dropdown changes a few times an hour at most, so serve it from memory
+SOURCES_TTL_SECONDS = 60.0
+_sources_cache: tuple[float, list[str]] | None = None
 
 
 @bp.get("/")
@@ -40,28 +53,56 @@ async def list_articles():
 
     filters, state = _build_filters()
 
-    async with current_app.config["SESSION_MAKER"]() as session:
-        total = await session.scalar(select(func.count()).select_from(Article).where(*filters)) or 0
-
-        stmt = (
-            select(Article)
-            .options(selectinload(Article.analyses))
-            .where(*filters)
-            .order_by(Article.published_at.desc().nullslast(), Article.created_at.desc())
-            .offset((page - 1) * per_page)
-            .limit(per_page)
-        )
-        articles = list(await session.scalars(stmt))
+    # The count, page and source queries are independent; an AsyncSession can't run
+    # statements concurrently, so each gets its own short-lived session.
+    # Tradeoff: the webapp engine uses NullPool, so every session is a fresh Postgres
+    # connect + auth. A page view now opens up to three connections at once (two when the
+    # sources cache is warm) instead of one, trading connection count and handshake work for
+    # latency. Peak connections are ~3x concurrent list requests; if that nears the server's
+    # max_connections, run these sequentially in one session again.
+    session_maker = current_app.config["SESSION_MAKER"]
+
+    async def _count() -> int:
+        async with session_maker() as session:
+            count_stmt = select(func.count()).select_from(Article).where(*filters)
+            return await session.scalar(count_stmt) or 0
+
+    async def _articles() -> tuple[list[Article], dict[int, tuple[int, ArticleAggregates]]]:
+        async with session_maker() as session:
+            # Relationships are rolled up in SQL below, so skip loading them here
+            stmt = (
+                select(Article)
+                .options(noload("*"))
+                .where(*filters)
+                .order_by(Article.published_at.desc().nullslast(), Article.created_at.desc())
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+            )
+            articles = list(await session.scalars(stmt))
+            return articles, await _analysis_rollups(session, [article.id for article in articles])
+
+    async def _sources() -> list[str]:
+        global _sources_cache
+        cached = _sources_cache
+        if cached and time.monotonic() - cached[0] < SOURCES_TTL_SECONDS:
+            return cached[1]
+
+        async with session_maker() as session:
+            sources_result = await session.execute(
+                select(func.distinct(Article.source))
+                .where(Article.source.is_not(None))
+                .order_by(Article.source)
+            )
+            sources = [row[0] for row in sources_result if row[0]]
+        _sources_cache = (time.monotonic(), sources)
+        return sources
 
-        sources_result = await session.execute(
-            select(func.distinct(Article.source))
-            .where(Article.source.is_not(None))
-            .order_by(Article.source)
-        )
-        sources = [row[0] for row in sources_result if row[0]]
+    total, (articles, rollups), sources = await asyncio.gather(_count(), _articles(), _sources())
 
     total_pages = max(math.ceil(total / per_page), 1) if total else 1
-    view_models = [_prepare_article_view(article) for article in articles]
+    view_models = [
+        _prepare_list_view(article, *rollups.get(article.id, _EMPTY_ROLLUP)) for article in articles
+    ]
 
     return render_template(
         "articles/list.html",
@@ -109,8 +150,17 @@ def _build_filters() -> tuple[list[Any], dict[str, str]]:
     }
 
     if state["q"]:
+        # Word matches (tsvector GIN) and substring matches (tickers, partial words; trigram GIN)
+        # form one id set. Each UNION branch gets its own index scan, whereas an IN (...) under
+        # an OR would force a sequential scan of articles.
         like = f"%{state['q']}%"
-        filters.append(or_(Article.title.ilike(like), Article.scraped_content.ilike(like)))
+        tsquery = func.plainto_tsquery("english", state["q"])
+        matching_ids = union(
+            select(Article.id).where(Article.search_tsv.op("@@")(tsquery)),
+            select(Article.id).where(Article.title.ilike(like)),
+            select(Article.id).where(Article.scraped_content.ilike(like)),
+        )
+        filters.append(Article.id.in_(matching_ids))
 
     if state["sentiment"] in SENTIMENT_CHOICES:
         filters.append(Article.analyses.any(ArticleAnalysis.sentiment == state["sentiment"]))
@@ -138,21 +188,84 @@ def _build_filters() -> tuple[list[Any], dict[str, str]]:
     return filters, state
 
 
+def invalidate_sources_cache() -> None:
+    """Drop the cached source list so the next page load re-queries it."""
+    global _sources_cache
+    _sources_cache = None
+
+
+_EMPTY_ROLLUP = (
+    0,
+    ArticleAggregates(sentiment=None, avg_sentiment=None, avg_impact=None, topics=()),
+)
+
+
+async def _analysis_rollups(
+    session, article_ids: list[int]
+) -> dict[int, tuple[int, ArticleAggregates]]:
+    """
+    Per-article analysis count and aggregates, computed in one grouped query.
+    """
+    if not article_ids:
+        return {}
+
+    stmt = (
+        select(
+            ArticleAnalysis.article_id,
+            func.count(),
+            func.avg(ArticleAnalysis.sentiment_score),
+            func.avg(ArticleAnalysis.impact_score),
+            func.array_agg(aggregate_order_by(ArticleAnalysis.sentiment, *_ANALYSIS_SQL_ORDER)),
+            func.jsonb_agg(
+                aggregate_order_by(ArticleAnalysis.key_topics, *_ANALYSIS_SQL_ORDER), type_=JSONB
+            ),
+        )
+        .where(ArticleAnalysis.article_id.in_(article_ids))
+        .group_by(ArticleAnalysis.article_id)
+    )
+    result = await session.execute(stmt)
+    return {
+        article_id: (
+            count,
+            aggregates_from_rollup(
+                sentiments=sentiments or (),
+                topic_lists=topic_lists or (),
+                avg_sentiment=avg_sentiment,
+                avg_impact=avg_impact,
+            ),
+        )
+        for article_id, count, avg_sentiment, avg_impact, sentiments, topic_lists in result
+    }
+
+
+def _prepare_list_view(
+    article: Article, analysis_count: int, aggregates: ArticleAggregates
+) -> dict[str, Any]:
+    return {
+        "article": article,
+        "analysis_count": analysis_count,
+        "sentiment": aggregates.sentiment,
+        "sentiment_class": sentiment_class(aggregates.sentiment),
+        "avg_sentiment": aggregates.avg_sentiment,
+        "avg_impact": aggregates.avg_impact,
+        "impact_percent": to_percent(aggregates.avg_impact),
+        "topics": list(aggregates.topics),
+    }
+
+
 def _prepare_article_view(article: Article) -> dict[str, Any]:
     analyses = sorted(article.analyses or [], key=_analysis_sort_key)
-    sentiment = sentiment_rollup(analyses)
-    avg_sentiment = average(a.sentiment_score for a in analyses)
-    avg_impact = average(a.impact_score for a in analyses)
+    aggregates = cached_aggregates(article.id, analyses)
 
     return {
         "article": article,
         "analyses": analyses,
-        "sentiment": sentiment,
-        "sentiment_class": sentiment_class(sentiment),
-        "avg_sentiment": to_float(avg_sentiment),
-        "avg_impact": to_float(avg_impact),
-        "impact_percent": to_percent(avg_impact),
-        "topics": collect_topics(analyses),
+        "sentiment": aggregates.sentiment,
+        "sentiment_class": sentiment_class(aggregates.sentiment),
+        "avg_sentiment": to_float(aggregates.avg_sentiment),
+        "avg_impact": to_float(aggregates.avg_impact),
+        "impact_percent": to_percent(aggregates.avg_impact),
+        "topics": list(aggregates.topics),
     }
 
 
@@ -171,8 +284,7 @@ def _prepare_analysis_view(analysis: ArticleAnalysis) -> dict[str, Any]:
     }
 
 
-def _analysis_sort_key(analysis: ArticleAnalysis) -> tuple[str, str]:
-    provider_order = {"anthropic": 0, "openai": 1, "google": 2}
+def _analysis_sort_key(analysis: ArticleAnalysis) -> tuple[int, str]:
     provider = (analysis.model_provider or "").lower()
-    return provider_order.get(provider, 99), analysis.model_name or ""
+    return _PROVIDER_ORDER.get(provider, 99), analysis.model_name or ""
 
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import math
 from typing import Any
 
-from flask import Blueprint, current_app, render_template
-from sqlalchemy import select
+from flask import Blueprint, current_app, render_template, request
+from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 
 from shared.database.models import Article, Digest, DigestArticle
-from webapp.utils import average, collect_topics, sentiment_class, sentiment_rollup, to_percent
+from webapp.utils import cached_aggregates, sentiment_class, to_percent
 
 bp = Blueprint("digests", __name__, url_prefix="/digests")
 
@@ -15,7 +16,15 @@ bp = Blueprint("digests", __name__, url_prefix="/digests")
 @bp.get("/")
 async def history():
     """Show previously sent digests with their ranked articles."""
+    per_page = int(current_app.config.get("PER_PAGE", 20))
+    try:
+        page = max(int(request.args.get("page", "1") or "1"), 1)
+    except ValueError:
+        page = 1
+
     async with current_app.config["SESSION_MAKER"]() as session:
+        total = await session.scalar(select(func.count()).select_from(Digest)) or 0
+
         stmt = (
             select(Digest)
             .options(
@@ -24,12 +33,22 @@ async def history():
                 .selectinload(Article.analyses)
             )
             .order_by(Digest.sent_at.desc())
+            .offset((page - 1) * per_page)
+            .limit(per_page)
         )
         digests = list(await session.scalars(stmt))
 
     prepared = [_prepare_digest_view(digest) for digest in digests]
 
-    return render_template("digests/history.html", digests=prepared)
+    total_pages = max(math.ceil(total / per_page), 1) if total else 1
+
+    return render_template(
+        "digests/history.html",
+        digests=prepared,
+        page=page,
+        total_pages=total_pages,
+        total=total,
+    )
 
 
 def _prepare_digest_view(digest: Digest) -> dict[str, Any]:
@@ -39,19 +58,17 @@ def _prepare_digest_view(digest: Digest) -> dict[str, Any]:
         if not article:
             continue
 
-        analyses = article.analyses or []
-        sentiment = sentiment_rollup(analyses)
-        avg_impact = average(a.impact_score for a in analyses)
+        aggregates = cached_aggregates(article.id, article.analyses or [], topic_limit=4)
 
         articles.append(
             {
                 "article": article,
                 "rank": record.rank,
-                "sentiment": sentiment,
-                "sentiment_class": sentiment_class(sentiment),
-                "impact_percent": to_percent(avg_impact),
-                "avg_impact": avg_impact,
-                "topics": collect_topics(analyses, limit=4),
+                "sentiment": aggregates.sentiment,
+                "sentiment_class": sentiment_class(aggregates.sentiment),
+                "impact_percent": to_percent(aggregates.avg_impact),
+                "avg_impact": aggregates.avg_impact,
+                "topics": list(aggregates.topics),
             }
         )
 
@@ -4,16 +4,53 @@ Shared helpers for the Flask web interface.
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Iterable
+from functools import lru_cache
+from itertools import chain
+from typing import Hashable, Iterable, Sequence
 
 from shared.database.models import ArticleAnalysis
 
+_SENTIMENT_CLASS_MAP = {
+    "bullish": "sentiment-bullish",
+    "bearish": "sentiment-bearish",
+    "neutral": "sentiment-neutral",
+    "mixed": "sentiment-mixed",
+}
 
+# Analyses only store Bullish/Bearish/Neutral (AnalysisResult enforces it), so rollups
+# tally into a fixed three-slot list instead of a per-call dict
+_SENTIMENT_NAMES = ("Bullish", "Bearish", "Neutral")
+_SENTIMENT_SLOTS = {name.lower(): slot for slot, name in enumerate(_SENTIMENT_NAMES)}
+
+# Computed aggregates keyed by (article id, analysis count, latest analyzed_at, topic limit).
+# Only derived values are cached, never ORM objects, since those belong to a request's session.
+# The cache is per process, so each web worker warms its own copy.
+AGGREGATE_CACHE_SIZE = 4096
+_AGGREGATE_CACHE: OrderedDict[Hashable, "ArticleAggregates"] = OrderedDict()
+_AGGREGATE_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class ArticleAggregates:
+    """Per-article rollup of its analyses for list, detail, and digest views."""
+
+    sentiment: str | None
+    avg_sentiment: float | None
+    avg_impact: float | None
+    topics: tuple[str, ...]
+
+
+@lru_cache(maxsize=4096)
 def parse_date(value: str | None) -> datetime | None:
     """
     Parse an ISO date string (YYYY-MM-DD) to an aware datetime in UTC.
+
+    Memoized on the raw string; filter dates repeat across page loads and results are immutable.
     """
     if not value:
         return None
@@ -35,59 +72,158 @@ def to_float(value: Decimal | float | int | None) -> float | None:
 
 def average(values: Iterable[Decimal | float | int | None]) -> float | None:
     """Return the arithmetic mean, ignoring None values."""
-    numeric = [to_float(v) for v in values if v is not None]
-    if not numeric:
+    total = 0.0
+    count = 0
+    for value in values:
+        if value is not None:
+            total += float(value)
+            count += 1
+    if not count:
         return None
-    return sum(numeric) / len(numeric)
+    return total / count
 
 
 def sentiment_rollup(analyses: Iterable[ArticleAnalysis]) -> str | None:
     """
     Return the dominant sentiment (Bullish/Bearish/Neutral) or 'Mixed' when tied.
     """
-    sentiments: dict[str, int] = {}
+    counts = [0, 0, 0]
     for analysis in analyses:
-        if not analysis.sentiment:
-            continue
-        normalized = analysis.sentiment.lower()
-        sentiments[normalized] = sentiments.get(normalized, 0) + 1
-
-    if not sentiments:
+        if analysis.sentiment:
+            slot = _SENTIMENT_SLOTS.get(analysis.sentiment.lower())
+            if slot is not None:
+                counts[slot] += 1
+
+    return _dominant_sentiment(counts)
+
+
+def _dominant_sentiment(counts: list[int]) -> str | None:
+    # Find the leader and detect a tie for first place in the same pass
+    leader = -1
+    best = 0
+    tied = False
+    for slot, count in enumerate(counts):
+        if count > best:
+            leader, best, tied = slot, count, False
+        elif count and count == best:
+            tied = True
+    if leader < 0:
         return None
-
-    leader, count = max(sentiments.items(), key=lambda item: item[1])
-    if list(sentiments.values()).count(count) > 1:
+    if tied:
         return "Mixed"
-    return leader.capitalize()
+    return _SENTIMENT_NAMES[leader]
 
 
 def sentiment_class(sentiment: str | None) -> str:
     """Map sentiment text to a CSS class suffix."""
     if not sentiment:
         return "sentiment-neutral"
-    mapping = {
-        "bullish": "sentiment-bullish",
-        "bearish": "sentiment-bearish",
-        "neutral": "sentiment-neutral",
-        "mixed": "sentiment-mixed",
-    }
-    return mapping.get(sentiment.lower(), "sentiment-neutral")
+    return _SENTIMENT_CLASS_MAP.get(sentiment.lower(), "sentiment-neutral")
 
 
 def collect_topics(analyses: Iterable[ArticleAnalysis], limit: int = 6) -> list[str]:
     """Combine and deduplicate key topics across analyses."""
-    topics: list[str] = []
-    seen: set[str] = set()
+    return list(_dedupe_topics((analysis.key_topics for analysis in analyses), limit))
+
+
+def _dedupe_topics(topic_lists: Iterable[Iterable[str] | None], limit: int) -> tuple[str, ...]:
+    # Lowercased topic -> first spelling seen; dicts keep insertion order
+    seen: dict[str, str] = {}
+    for topic in chain.from_iterable(topics or () for topics in topic_lists):
+        seen.setdefault(topic.lower(), topic)
+        if len(seen) >= limit:
+            break
+    return tuple(seen.values())
+
+
+def aggregate_analyses(
+    analyses: Iterable[ArticleAnalysis], *, topic_limit: int = 6
+) -> ArticleAggregates:
+    """
+    Compute sentiment rollup, score averages, and topics in a single pass over the analyses.
+
+    Matches sentiment_rollup, average, and collect_topics applied separately.
+    """
+    sentiment_counts = [0, 0, 0]
+    sentiment_total = 0.0
+    sentiment_n = 0
+    impact_total = 0.0
+    impact_n = 0
+    topics: dict[str, str] = {}
+    topics_full = False
+
     for analysis in analyses:
-        for topic in analysis.key_topics or []:
-            normalized = topic.lower()
-            if normalized in seen:
-                continue
-            seen.add(normalized)
-            topics.append(topic)
-            if len(topics) >= limit:
-                return topics
-    return topics
+        if analysis.sentiment:
+            slot = _SENTIMENT_SLOTS.get(analysis.sentiment.lower())
+            if slot is not None:
+                sentiment_counts[slot] += 1
+        if analysis.sentiment_score is not None:
+            sentiment_total += float(analysis.sentiment_score)
+            sentiment_n += 1
+        if analysis.impact_score is not None:
+            impact_total += float(analysis.impact_score)
+            impact_n += 1
+        if not topics_full:
+            for topic in analysis.key_topics or ():
+                topics.setdefault(topic.lower(), topic)
+                if len(topics) >= topic_limit:
+                    topics_full = True
+                    break
+
+    return ArticleAggregates(
+        sentiment=_dominant_sentiment(sentiment_counts),
+        avg_sentiment=sentiment_total / sentiment_n if sentiment_n else None,
+        avg_impact=impact_total / impact_n if impact_n else None,
+        topics=tuple(topics.values()),
+    )
+
+
+def aggregates_from_rollup(
+    *,
+    sentiments: Iterable[str | None],
+    topic_lists: Iterable[Iterable[str] | None],
+    avg_sentiment: Decimal | float | None,
+    avg_impact: Decimal | float | None,
+    topic_limit: int = 6,
+) -> ArticleAggregates:
+    """
+    Build aggregates from a SQL-side rollup: per-article averages plus ordered sentiment and
+    topic arrays.
+    """
+    tallies = [0, 0, 0]
+    for sentiment in sentiments:
+        if sentiment:
+            slot = _SENTIMENT_SLOTS.get(sentiment.lower())
+            if slot is not None:
+                tallies[slot] += 1
+    return ArticleAggregates(
+        sentiment=_dominant_sentiment(tallies),
+        avg_sentiment=to_float(avg_sentiment),
+        avg_impact=to_float(avg_impact),
+        topics=_dedupe_topics(topic_lists, topic_limit),
+    )
+
+
+def cached_aggregates(
+    article_id: int, analyses: Sequence[ArticleAnalysis], *, topic_limit: int = 6
+) -> ArticleAggregates:
+    """
+    Return the article's aggregates, recomputing only when its analyses have changed.
+    """
+    latest = max((a.analyzed_at for a in analyses if a.analyzed_at is not None), default=None)
+    key = (article_id, len(analyses), latest, topic_limit)
+    with _AGGREGATE_CACHE_LOCK:
+        cached = _AGGREGATE_CACHE.get(key)
+        if cached is not None:
+            _AGGREGATE_CACHE.move_to_end(key)
+            return cached
+
+    aggregates = aggregate_analyses(analyses, topic_limit=topic_limit)
+    with _AGGREGATE_CACHE_LOCK:
+        _AGGREGATE_CACHE[key] = aggregates
+        if len(_AGGREGATE_CACHE) > AGGREGATE_CACHE_SIZE:
+            _AGGREGATE_CACHE.popitem(last=False)
+    return aggregates
 
 
 def to_percent(value: float | None) -> int | None:
@@ -1,50 +1,106 @@
 import asyncio
 import json
 
+import orjson
 import pytest
 
-from shared.services.analyzers import GeminiAnalyzer
+from shared.services import analyzers
+from shared.services.analyzers import (
+    METRICS_PROMPT_TEMPLATE,
+    ClaudeAnalyzer,
+    GeminiAnalyzer,
+    OpenAIAnalyzer,
+    _build_prompt_json,
+    _truncate_for_budget,
+)
 
 
-class _FakeModel:
-    def __init__(self, response_text: str):
-        self.response_text = response_text
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    analyzers._RESULT_CACHE.clear()
+    yield
+    analyzers._RESULT_CACHE.clear()
+
+
+class _FakeStreamResponse:
+    def __init__(self, lines: list[str]):
+        self._lines = lines
+
+    def raise_for_status(self):
+        return None
+
+    async def aiter_lines(self):
+        for line in self._lines:
+            yield line
+
+
+class _FakeStream:
+    def __init__(self, response):
+        self._response = response
+
+    async def __aenter__(self):
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict):
+        self.content = json.dumps(payload).encode()
+
+    def raise_for_status(self):
+        return None
+
+
+class _FakeClient:
+    """Fake httpx client: `stream` replays SSE events, `post` answers via `post_handler`."""
+
+    def __init__(self, events: list[dict] | None = None, post_handler=None):
+        self.events = events or []
+        self.post_handler = post_handler
         self.calls = []
 
-    def generate_content(self, payload):
-        self.calls.append(payload)
+    def stream(self, method, url, **kwargs):
+        self.calls.append({"method": method, "url": url, **kwargs})
+        lines = []
+        for event in self.events:
+            lines += [f"data: {json.dumps(event)}", ""]
+        return _FakeStream(_FakeStreamResponse(lines))
 
-        class Resp:
-            def __init__(self, text: str):
-                self.text = text
+    async def post(self, url, **kwargs):
+        self.calls.append({"url": url, **kwargs})
+        return _FakeResponse(self.post_handler(orjson.loads(kwargs["content"])))
 
-        return Resp(self.response_text)
 
+def _gemini_events(text: str) -> list[dict]:
+    # Split the answer across two SSE events to exercise chunk joining
+    half = len(text) // 2
+    return [
+        {"candidates": [{"content": {"parts": [{"text": piece}]}}]}
+        for piece in (text[:half], text[half:])
+    ]
 
-def _fake_response():
-    return json.dumps(
-        {
-            "summary": "summary",
-            "sentiment": "Neutral",
-            "sentiment_score": 0.1,
-            "confidence": 0.82,
-            "impact_score": 0.2,
-            "key_topics": ["markets"],
-        }
-    )
 
+def _fake_response(include_summary: bool = True):
+    payload = {
+        "sentiment": "Neutral",
+        "sentiment_score": 0.1,
+        "confidence": 0.82,
+        "impact_score": 0.2,
+        "key_topics": ["markets"],
+    }
+    if include_summary:
+        payload["summary"] = "summary"
+    return json.dumps(payload)
 
-@pytest.mark.asyncio
-async def test_gemini_analyze_text(monkeypatch):
-    fake_model = _FakeModel(_fake_response())
 
-    monkeypatch.setattr("shared.services.analyzers.genai.configure", lambda api_key: None)
-    monkeypatch.setattr(
-        "shared.services.analyzers.genai.GenerativeModel",
-        lambda model_name: fake_model,
-    )
+@pytest.mark.asyncio
+async def test_gemini_analyze_text():
+    # Gemini is sent the metrics-only prompt, so it answers without a summary
+    fake_client = _FakeClient(_gemini_events(_fake_response(include_summary=False)))
 
-    analyzer = GeminiAnalyzer("token")
+    analyzer = GeminiAnalyzer("token", _http_client=fake_client)
     result = await analyzer.analyze(
         title="Title",
         source="Source",
@@ -54,22 +110,22 @@ async def test_gemini_analyze_text(monkeypatch):
 
     assert result.summary is None
     assert result.confidence == 0.82
-    assert len(fake_model.calls) == 1
-    assert isinstance(fake_model.calls[0], str)
-    assert "Title: Title" in fake_model.calls[0]
+    assert len(fake_client.calls) == 1
+    call = fake_client.calls[0]
+    assert call["url"].endswith("/gemini-2.5-pro:streamGenerateContent")
+    assert call["params"] == {"alt": "sse"}
+    assert call["headers"]["x-goog-api-key"] == "token"
+    parts = orjson.loads(call["content"])["contents"][0]["parts"]
+    assert len(parts) == 1
+    assert "Title: Title" in parts[0]["text"]
 
 
 @pytest.mark.asyncio
-async def test_gemini_analyze_youtube(monkeypatch):
-    fake_model = _FakeModel(_fake_response())
-
-    monkeypatch.setattr("shared.services.analyzers.genai.configure", lambda api_key: None)
-    monkeypatch.setattr(
-        "shared.services.analyzers.genai.GenerativeModel",
-        lambda model_name: fake_model,
-    )
+async def test_gemini_analyze_youtube():
+    # Gemini is sent the metrics-only prompt, so it answers without a summary
+    fake_client = _FakeClient(_gemini_events(_fake_response(include_summary=False)))
 
-    analyzer = GeminiAnalyzer("token")
+    analyzer = GeminiAnalyzer("token", _http_client=fake_client)
     result = await analyzer.analyze(
         title="Title",
         source="Source",
@@ -80,9 +136,163 @@ async def test_gemini_analyze_youtube(monkeypatch):
 
     assert result.summary is None
     assert result.confidence == 0.82
-    assert len(fake_model.calls) == 1
-    payload = fake_model.calls[0]
-    assert isinstance(payload, list)
-    assert payload[0]["file_data"]["file_uri"] == "https://youtu.be/abc"
-    assert "Watch the attached YouTube video" in payload[1]
+    assert len(fake_client.calls) == 1
+    parts = orjson.loads(fake_client.calls[0]["content"])["contents"][0]["parts"]
+    assert parts[0]["file_data"]["file_uri"] == "https://youtu.be/abc"
+    assert "Watch the attached YouTube video" in parts[1]["text"]
+
+
+@pytest.mark.asyncio
+async def test_gemini_reuses_cached_result_for_identical_prompt():
+    fake_client = _FakeClient(_gemini_events(_fake_response()))
+    analyzer = GeminiAnalyzer("token", _http_client=fake_client)
+    kwargs = dict(title="Title", source="Source", published_at="2025-01-01", content="Body text")
+
+    first = await analyzer.analyze(**kwargs)
+    second = await analyzer.analyze(**kwargs)
+    await analyzer.analyze(**{**kwargs, "content": "Other body"})
+
+    assert second == first
+    assert second is not first
+    assert len(fake_client.calls) == 2
+
+
+class _SlowGeminiClient(_FakeClient):
+    """Holds each stream open briefly so concurrent calls contend for the Gemini semaphore."""
+
+    def stream(self, method, url, **kwargs):
+        ctx = super().stream(method, url, **kwargs)
+        lines = ctx._response._lines
+
+        async def slow_lines():
+            await asyncio.sleep(0.01)
+            for line in lines:
+                yield line
+
+        ctx._response.aiter_lines = slow_lines
+        return ctx
+
+
+def test_gemini_semaphore_survives_multiple_event_loops():
+    client = _SlowGeminiClient(_gemini_events(_fake_response()))
+    analyzer = GeminiAnalyzer("token", _http_client=client)
+    calls = analyzers.GEMINI_MAX_CONCURRENCY + 5  # more than the cap, so callers wait
+
+    async def burst(tag: str):
+        return await asyncio.gather(
+            *(
+                analyzer.analyze(title="T", source="S", published_at=None, content=f"{tag}-{i}")
+                for i in range(calls)
+            )
+        )
+
+    # A loop-bound module semaphore raised "bound to a different event loop" on the second run
+    assert len(asyncio.run(burst("first"))) == calls
+    assert len(asyncio.run(burst("second"))) == calls
+
+
+def _batch_answer(body: dict) -> dict:
+    count = body["messages"][0]["content"].count("### Article ")
+    analyses = [
+        {"sentiment": "Bullish", "sentiment_score": i / 10, "impact_score": 0.5, "key_topics": []}
+        for i in range(count)
+    ]
+    return {"choices": [{"message": {"content": json.dumps({"analyses": analyses})}}]}
+
+
+@pytest.mark.asyncio
+async def test_openai_analyze_streams_structured_output():
+    raw = _fake_response()
+    events = [
+        {"choices": [{"delta": {"content": raw[:10]}}]},
+        {"choices": [{"delta": {"content": raw[10:]}}]},
+    ]
+    fake_client = _FakeClient(events)
+
+    result = await OpenAIAnalyzer("token", _http_client=fake_client).analyze(
+        title="Title", source="Source", published_at="2025-01-01", content="Body text"
+    )
+
+    assert result.sentiment_score == 0.1
+    call = fake_client.calls[0]
+    assert call["headers"]["Authorization"] == "Bearer token"
+    body = orjson.loads(call["content"])
+    assert body["stream"] is True
+    assert body["response_format"]["json_schema"]["strict"] is True
+    assert "Title: Title" in body["messages"][0]["content"]
+
+
+@pytest.mark.asyncio
+async def test_openai_analyze_many_batches_articles():
+    fake_client = _FakeClient(post_handler=_batch_answer)
+
+    articles = [
+        {"title": f"T{i}", "source": "S", "published_at": None, "content": "x" * 40}
+        for i in range(5)
+    ]
+    analyzer = OpenAIAnalyzer("token", _http_client=fake_client)
+    results = await analyzer.analyze_many(articles, max_batch_size=3)
+
+    assert len(fake_client.calls) == 2
+    assert [r.sentiment_score for r in results] == [0.0, 0.1, 0.2, 0.0, 0.1]
+    first_body = orjson.loads(fake_client.calls[0]["content"])
+    assert "### Article 3\nTitle: T2" in first_body["messages"][0]["content"]
+    assert first_body["response_format"]["json_schema"]["strict"] is True
+
+
+@pytest.mark.asyncio
+async def test_claude_analyze_reads_forced_tool_input():
+    raw = _fake_response()
+    events = [
+        {"type": "message_start"},
+        {
+            "type": "content_block_delta",
+            "delta": {"type": "input_json_delta", "partial_json": raw[:10]},
+        },
+        {
+            "type": "content_block_delta",
+            "delta": {"type": "input_json_delta", "partial_json": raw[10:]},
+        },
+        {"type": "message_stop"},
+    ]
+    fake_client = _FakeClient(events)
+
+    result = await ClaudeAnalyzer("token", _http_client=fake_client).analyze(
+        title="Title", source="Source", published_at="2025-01-01", content="Body text"
+    )
+
+    assert result.summary == "summary"
+    call = fake_client.calls[0]
+    assert call["headers"]["x-api-key"] == "token"
+    body = orjson.loads(call["content"])
+    assert body["tool_choice"] == {"type": "tool", "name": "record_analysis"}
+    assert body["stream"] is True
+
+
+def test_prompt_json_matches_encoded_prompt():
+    kwargs = dict(
+        title='Fed "holds" rates',
+        source=None,
+        published_at="2025-01-01",
+        content="Línea 1\n\tquote: \"x\" {braces}",
+        include_summary=False,
+    )
+
+    expected = METRICS_PROMPT_TEMPLATE.format(
+        title=kwargs["title"],
+        source="Unknown",
+        published_at="2025-01-01",
+        content=kwargs["content"],
+    )
+
+    assert _build_prompt_json(**kwargs) == orjson.dumps(expected)
+
+
+def test_truncate_for_budget_keeps_head_and_tail():
+    content = "H" * 300 + "M" * 400 + "T" * 100
 
+    assert _truncate_for_budget("short", 100) == "short"
+    truncated = _truncate_for_budget(content, 400)
+    head, tail = truncated.split("\n...[TRUNCATED]...\n")
+    assert head == "H" * 300
+    assert tail == "T" * 100
@@ -1,10 +1,14 @@
 import asyncio
 
+import pytest
+
 from shared.schemas.analysis import AnalysisResult
 from shared.services.analyzers import run_all_analyzers
 
 
 class _FakeAnalyzer:
+    supports_youtube = False
+
     def __init__(self, provider: str, model: str, summary: str):
         self.provider = provider
         self.model = model
@@ -40,3 +44,45 @@ def test_run_all_analyzers_returns_provider_and_model():
     assert models == ["claude", "gpt"]
     assert summaries == ["A", "B"]
 
+
+class _FakeVideoAnalyzer(_FakeAnalyzer):
+    supports_youtube = True
+
+    async def analyze(self, *, youtube_url: str | None = None, **kwargs) -> AnalysisResult:
+        self.youtube_url = youtube_url
+        return await super().analyze(**kwargs)
+
+
+def test_run_all_analyzers_passes_youtube_url_only_to_video_analyzers():
+    video = _FakeVideoAnalyzer("google", "gemini", "V")
+    text_only = _FakeAnalyzer("anthropic", "claude", "A")
+
+    results = asyncio.run(
+        run_all_analyzers(
+            analyzers=[video, text_only],
+            title="t",
+            source="s",
+            published_at=None,
+            content="c",
+            youtube_url="https://youtu.be/abc",
+        )
+    )
+
+    assert video.youtube_url == "https://youtu.be/abc"
+    assert [p for p, _m, _r in results] == ["google", "anthropic"]
+
+
+class _FailingAnalyzer(_FakeAnalyzer):
+    async def analyze(self, **kwargs) -> AnalysisResult:
+        raise ValueError(f"{self.provider} exploded")
+
+
+def test_run_all_analyzers_raises_the_provider_error_not_a_group():
+    analyzers = [_FakeAnalyzer("anthropic", "claude", "A"), _FailingAnalyzer("openai", "gpt", "B")]
+
+    with pytest.raises(ValueError, match="openai exploded"):
+        asyncio.run(
+            run_all_analyzers(
+                analyzers=analyzers, title="t", source="s", published_at=None, content="c"
+            )
+        )
@@ -1,6 +1,8 @@
+import asyncio
+
 import httpx
 
-from shared.services.discord import DiscordNotifier
+from shared.services.discord import DiscordNotifier, count_sentiments
 
 
 def test_parse_message_id_handles_no_content():
@@ -8,3 +10,100 @@ def test_parse_message_id_handles_no_content():
     notifier = DiscordNotifier(digests_webhook="http://example.com")
     assert notifier._parse_message_id(resp) is None
 
+
+def test_owned_client_is_reused_until_closed():
+    notifier = DiscordNotifier(alerts_webhook="http://example.com")
+    client = notifier._get_client()
+    assert notifier._get_client() is client
+
+    asyncio.run(notifier.close())
+    assert client.is_closed
+    assert notifier._get_client() is not client
+
+
+def test_sentiment_footer_uses_precomputed_counts():
+    analyses = [{"sentiment": "Bullish"}, {"sentiment": "bullish"}, {"sentiment": None}]
+    counts = count_sentiments(analyses)
+    assert counts == {"bullish": 2}
+
+    notifier = DiscordNotifier(alerts_webhook="http://example.com")
+    footer = notifier._build_sentiment_footer(analyses, "Bullish", 7, sentiment_counts=counts)
+    assert footer == notifier._build_sentiment_footer(analyses, "Bullish", 7)
+    assert "agree on bullish" in footer
+
+
+def test_should_send_alert_tally_matches_precomputed_counts():
+    analyses = [
+        {"sentiment": "Bullish", "impact_score": 0.9},
+        {"sentiment": "Bearish", "impact_score": 0.9},
+        {"sentiment": None, "impact_score": 0.9},
+    ]
+    notifier = DiscordNotifier(alerts_webhook="http://example.com", impact_threshold=0.5)
+
+    precomputed = notifier.should_send_alert(
+        analyses, "Bullish", 0.9, sentiment_counts=count_sentiments(analyses)
+    )
+    assert notifier.should_send_alert(analyses, "Bullish", 0.9) is precomputed
+
+
+def test_parse_message_id_reads_json_body():
+    resp = httpx.Response(
+        status_code=200, content=b'{"id": "123"}', request=httpx.Request("POST", "http://example.com")
+    )
+    assert DiscordNotifier._parse_message_id(resp) == "123"
+
+
+class _RateLimitedClient:
+    def __init__(self, statuses):
+        self._statuses = list(statuses)
+        self.posts = 0
+
+    async def post(self, url, content, headers):
+        self.posts += 1
+        status = self._statuses.pop(0)
+        return httpx.Response(
+            status_code=status, headers={"Retry-After": "0"}, request=httpx.Request("POST", url)
+        )
+
+
+def test_send_article_alerts_retries_rate_limited_posts():
+    client = _RateLimitedClient([429, 204, 204])
+    notifier = DiscordNotifier(alerts_webhook="http://example.com", http_client=client)
+    job = {
+        "article_id": 1,
+        "title": "Headline",
+        "source": "Example",
+        "published_at": None,
+        "news_url": "http://example.com/a",
+        "sentiment": "Bullish",
+        "avg_sentiment_score": 0.5,
+        "avg_impact_score": 0.9,
+        "analyses": [{"model_provider": "openai", "sentiment": "Bullish", "impact_score": 0.9}],
+        "key_topics": ["rates"],
+    }
+
+    results = asyncio.run(notifier.send_article_alerts([job, {**job, "article_id": 2}]))
+
+    assert results == [True, True]
+    assert client.posts == 3
+
+
+def test_fire_and_forget_alerts_complete_on_drain():
+    async def _run():
+        notifier = DiscordNotifier(alerts_webhook="http://example.com")
+        sent = []
+
+        async def _fake_send(**kwargs):
+            await asyncio.sleep(0)
+            sent.append(kwargs["article_id"])
+            return True
+
+        notifier.send_article_alert = _fake_send
+        tasks = [notifier.fire_and_forget_alert(article_id=i) for i in (1, 2)]
+        await notifier.drain()
+        return sent, tasks, notifier._pending
+
+    sent, tasks, pending = asyncio.run(_run())
+    assert sorted(sent) == [1, 2]
+    assert all(task.done() for task in tasks)
+    assert not pending
@@ -1,5 +1,4 @@
-import asyncio
-
+import orjson
 import pytest
 
 from shared.services.firecrawl import FirecrawlClient
@@ -7,37 +6,32 @@ from shared.services.firecrawl import FirecrawlClient
 
 class _FakeResponse:
     def __init__(self, payload):
-        self._payload = payload
+        self.content = orjson.dumps(payload)
 
     def raise_for_status(self):
         return None
 
-    def json(self):
-        return self._payload
-
 
 class _FakeClient:
     def __init__(self, payload):
         self._payload = payload
         self.post_calls = []
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
+        self.is_closed = False
 
     async def post(self, url, json, headers):
         self.post_calls.append({"url": url, "json": json, "headers": headers})
         return _FakeResponse(self._payload)
 
+    async def aclose(self):
+        self.is_closed = True
+
 
 @pytest.mark.asyncio
 async def test_scrape_returns_markdown(monkeypatch):
     payload = {"data": {"markdown": "hello world"}}
     fake_client = _FakeClient(payload)
     monkeypatch.setattr(
-        "shared.services.firecrawl.httpx.AsyncClient", lambda timeout: fake_client
+        "shared.services.firecrawl.httpx.AsyncClient", lambda **kwargs: fake_client
     )
 
     client = FirecrawlClient("token")
@@ -53,7 +47,7 @@ async def test_scrape_returns_none_when_no_content(monkeypatch):
     payload = {"data": {}}
     fake_client = _FakeClient(payload)
     monkeypatch.setattr(
-        "shared.services.firecrawl.httpx.AsyncClient", lambda timeout: fake_client
+        "shared.services.firecrawl.httpx.AsyncClient", lambda **kwargs: fake_client
     )
 
     client = FirecrawlClient("token")
@@ -61,3 +55,47 @@ async def test_scrape_returns_none_when_no_content(monkeypatch):
 
     assert result is None
 
+
+@pytest.mark.asyncio
+async def test_scrape_reuses_owned_client_until_closed(monkeypatch):
+    created = []
+    factory_kwargs = []
+
+    def _factory(**kwargs):
+        factory_kwargs.append(kwargs)
+        created.append(_FakeClient({"data": {"markdown": "body"}}))
+        return created[-1]
+
+    monkeypatch.setattr("shared.services.firecrawl.httpx.AsyncClient", _factory)
+
+    client = FirecrawlClient("token")
+    await client.scrape("http://example.com/a")
+    await client.scrape("http://example.com/b")
+
+    assert len(created) == 1
+    assert len(created[0].post_calls) == 2
+    assert factory_kwargs[0]["headers"] == {"Authorization": "Bearer token"}
+    assert created[0].post_calls[0]["headers"] is None
+
+    await client.close()
+    assert created[0].is_closed
+
+
+@pytest.mark.asyncio
+async def test_scrape_replaces_owned_client_closed_elsewhere(monkeypatch):
+    created = []
+
+    def _factory(**kwargs):
+        created.append(_FakeClient({"data": {"markdown": "body"}}))
+        return created[-1]
+
+    monkeypatch.setattr("shared.services.firecrawl.httpx.AsyncClient", _factory)
+
+    client = FirecrawlClient("token")
+    await client.scrape("http://example.com/a")
+    await created[0].aclose()
+    result = await client.scrape("http://example.com/b")
+
+    assert result == "body"
+    assert len(created) == 2
+    assert len(created[1].post_calls) == 1
@@ -0,0 +1,72 @@
+import httpx
+import pytest
+
+from shared.services import http_client
+from shared.services.http_client import ManagedHttpClient, close_http_client, is_client_initialized
+
+
+@pytest.mark.asyncio
+async def test_managed_client_closes_only_after_last_release():
+    limits = httpx.Limits(max_connections=4)
+    try:
+        async with ManagedHttpClient(limits=limits, close_on_last_release=True) as outer:
+            async with ManagedHttpClient(limits=limits, close_on_last_release=True) as inner:
+                assert inner is outer
+            assert is_client_initialized()
+            assert not outer.is_closed
+
+        assert not is_client_initialized()
+        assert outer.is_closed
+        assert http_client._refcount == 0
+    finally:
+        await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_managed_client_stays_warm_without_close_flag():
+    limits = httpx.Limits(max_connections=4)
+    try:
+        async with ManagedHttpClient(limits=limits, close_on_last_release=False) as client:
+            pass
+
+        assert is_client_initialized()
+        assert not client.is_closed
+    finally:
+        await close_http_client()
+
+
+def test_default_limits_apply_env_overrides_and_clamp_keepalive(monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.setenv("HTTP_MAX_CONNECTIONS", "50")
+    monkeypatch.setenv("HTTP_KEEPALIVE_EXPIRY", "30")
+
+    limits = http_client._default_limits()
+
+    assert limits.max_connections == 50
+    assert limits.max_keepalive_connections == 50  # clamped to max_connections
+    assert limits.keepalive_expiry == 30.0
+
+
+def test_default_limits_ignore_invalid_env_values(monkeypatch):
+    monkeypatch.setenv("HTTP_MAX_CONNECTIONS", "lots")
+    monkeypatch.setenv("HTTP_KEEPALIVE_EXPIRY", "-5")
+
+    limits = http_client._default_limits()
+
+    assert limits.max_connections == http_client.DEFAULT_LIMITS.max_connections
+    assert limits.max_keepalive_connections == http_client.DEFAULT_LIMITS.max_keepalive_connections
+    assert limits.keepalive_expiry == http_client.DEFAULT_LIMITS.keepalive_expiry
+
+
+@pytest.mark.asyncio
+async def test_managed_client_close_flag_defaults_to_env(monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.setenv("HTTP_CLOSE_ON_LAST_RELEASE", "true")
+    try:
+        async with ManagedHttpClient(limits=httpx.Limits(max_connections=4)) as client:
+            pass
+
+        assert client.is_closed
+        assert not is_client_initialized()
+    finally:
+        await close_http_client()
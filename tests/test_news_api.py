@@ -1,7 +1,7 @@
 import pytest
 from datetime import datetime, timedelta, timezone
 
-from shared.services.news_api import NewsItem, filter_new_articles, is_paywalled
+from shared.services.news_api import NewsItem, StockNewsClient, filter_new_articles, is_paywalled
 
 
 def test_is_paywalled_detects_paywall_flags():
@@ -39,6 +39,22 @@ def test_filter_new_articles_removes_duplicates_and_paywalls():
     assert filtered[0].news_url == "http://a.com"
 
 
+def test_filter_new_articles_keeps_first_clean_copy_of_in_batch_duplicates():
+    items = [
+        NewsItem(news_url="http://a.com", title="A paywalled", topics=["paywall"]),
+        NewsItem(news_url="http://a.com", title="A", topics=["finance"]),
+        NewsItem(news_url="http://a.com", title="A again", topics=["finance"]),
+        NewsItem(news_url="http://b.com", title="B", topics=["economy"]),
+    ]
+
+    filtered = filter_new_articles(items, set())
+
+    assert [(i.news_url, i.title) for i in filtered] == [
+        ("http://a.com", "A"),
+        ("http://b.com", "B"),
+    ]
+
+
 def test_published_at_parses_rfc2822_date():
     item = NewsItem(
         news_url="http://example.com",
@@ -46,8 +62,88 @@ def test_published_at_parses_rfc2822_date():
         date="Mon, 08 Dec 2025 16:27:10 -0500",
     )
 
-    dt = item.published_at()
+    dt = item.published_at
 
     assert dt is not None
     assert dt == datetime(2025, 12, 8, 16, 27, 10, tzinfo=timezone(timedelta(hours=-5)))
 
+
+def test_published_at_parses_iso_date_and_caches_by_string():
+    first = NewsItem(news_url="http://example.com/a", title="A", date="2025-12-08T16:27:10Z")
+    second = NewsItem(news_url="http://example.com/b", title="B", date="2025-12-08T16:27:10Z")
+
+    assert first.published_at == datetime(2025, 12, 8, 16, 27, 10, tzinfo=timezone.utc)
+    assert second.published_at is first.published_at
+    undated = NewsItem(news_url="http://example.com/c", title="C", date="not a date")
+    assert undated.published_at is None
+
+
+def test_published_at_is_cached_per_item_and_not_serialized():
+    item = NewsItem(
+        news_url="http://example.com", title="Sample", date="Mon, 08 Dec 2025 16:27:10 -0500"
+    )
+
+    parsed = item.published_at
+
+    # Parsed once per instance; the raw payload stored from model_dump() stays as the feed sent it
+    assert vars(item)["published_at"] is parsed
+    assert "published_at" not in item.model_dump()
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+class _FakeClient:
+    def __init__(self, payload):
+        self._payload = payload
+        self.get_calls = []
+
+    async def get(self, url, params, timeout):
+        self.get_calls.append({"url": url, "params": params, "timeout": timeout})
+        return _FakeResponse(self._payload)
+
+
+@pytest.mark.asyncio
+async def test_fetch_latest_uses_shared_client(monkeypatch):
+    fake_client = _FakeClient({"data": [{"news_url": "http://a.com", "title": "A"}]})
+    monkeypatch.setattr("shared.services.news_api.get_http_client", lambda: fake_client)
+
+    client = StockNewsClient("token")
+    first = await client.fetch_latest(page=1)
+    await client.fetch_latest(page=2)
+
+    assert [item.news_url for item in first] == ["http://a.com"]
+    assert [call["params"]["page"] for call in fake_client.get_calls] == [1, 2]
+    assert fake_client.get_calls[0]["timeout"] == client.timeout
+
+
+@pytest.mark.asyncio
+async def test_fetch_pages_merges_pages_in_order_without_duplicates(monkeypatch):
+    pages = {
+        1: [
+            NewsItem(news_url="http://a.com", title="A"),
+            NewsItem(news_url="http://b.com", title="B"),
+        ],
+        2: [
+            NewsItem(news_url="http://b.com", title="B"),
+            NewsItem(news_url="http://c.com", title="C"),
+        ],
+    }
+
+    async def _fake_fetch_latest(self, *, page, section):
+        assert section == "general"
+        return pages[page]
+
+    monkeypatch.setattr(StockNewsClient, "fetch_latest", _fake_fetch_latest)
+
+    items = await StockNewsClient("token").fetch_pages(pages=2, section="general")
+
+    assert [item.news_url for item in items] == ["http://a.com", "http://b.com", "http://c.com"]
@@ -1,6 +1,9 @@
 from datetime import datetime, timezone
 
+import pytest
+
 from shared.schemas.queue_messages import ArticleQueueMessage
+from shared.services.queue import QueueService
 
 
 def test_article_queue_message_serialization():
@@ -17,3 +20,31 @@ def test_article_queue_message_serialization():
     assert "example.com" in payload
     assert now.isoformat()[:19] in payload
 
+
+class _FakeQueueClient:
+    def __init__(self, fail_on=None):
+        self.sent = []
+        self._fail_on = fail_on
+
+    async def send_message(self, payload):
+        if self._fail_on and self._fail_on in payload:
+            raise RuntimeError("boom")
+        self.sent.append(payload)
+
+
+@pytest.mark.asyncio
+async def test_send_article_messages_reports_per_message_errors():
+    now = datetime.now(timezone.utc)
+    messages = [
+        ArticleQueueMessage(
+            article_id=i, news_url=f"http://example.com/{i}", source="Example", published_at=now
+        )
+        for i in (1, 2, 3)
+    ]
+    fake = _FakeQueueClient(fail_on="example.com/2")
+    service = QueueService(connection_string="unused", queue_name="articles", _client=fake)
+
+    errors = await service.send_article_messages(messages)
+
+    assert [e is None for e in errors] == [True, False, True]
+    assert len(fake.sent) == 2
@@ -1,6 +1,9 @@
 from datetime import datetime, timezone
+from decimal import Decimal
 from types import SimpleNamespace
 
+import pytest
+
 from webapp import utils
 
 
@@ -39,3 +42,77 @@ def test_parse_date_returns_aware_datetime():
     assert parsed.tzinfo == timezone.utc
     assert parsed.year == 2025
 
+
+def test_cached_aggregates_recomputes_when_analyses_change():
+    utils._AGGREGATE_CACHE.clear()
+    first = SimpleNamespace(
+        sentiment="Bullish", sentiment_score=0.5, impact_score=0.8, key_topics=["Fed"],
+        analyzed_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+    aggregates = utils.cached_aggregates(1, [first])
+    assert aggregates.sentiment == "Bullish"
+    assert utils.cached_aggregates(1, [first]) is aggregates
+
+    second = SimpleNamespace(
+        sentiment="Bearish", sentiment_score=-0.5, impact_score=0.4, key_topics=["Jobs"],
+        analyzed_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
+    )
+    updated = utils.cached_aggregates(1, [first, second])
+    assert updated.sentiment == "Mixed"
+    assert updated.topics == ("Fed", "Jobs")
+
+
+def test_aggregate_analyses_matches_separate_helpers():
+    analyses = [
+        SimpleNamespace(
+            sentiment="Bullish",
+            sentiment_score=0.4,
+            impact_score=0.9,
+            key_topics=["Fed", "Rates"],
+        ),
+        SimpleNamespace(
+            sentiment="bearish",
+            sentiment_score=None,
+            impact_score=0.5,
+            key_topics=["rates", "Jobs"],
+        ),
+        SimpleNamespace(sentiment=None, sentiment_score=-0.2, impact_score=None, key_topics=None),
+    ]
+
+    aggregates = utils.aggregate_analyses(analyses, topic_limit=2)
+
+    assert aggregates.sentiment == utils.sentiment_rollup(analyses) == "Mixed"
+    assert aggregates.avg_sentiment == utils.average(a.sentiment_score for a in analyses)
+    assert aggregates.avg_impact == utils.average(a.impact_score for a in analyses)
+    assert list(aggregates.topics) == utils.collect_topics(analyses, limit=2) == ["Fed", "Rates"]
+
+
+def test_aggregates_from_rollup_matches_python_aggregation():
+    analyses = [
+        SimpleNamespace(
+            sentiment="Bullish",
+            sentiment_score=0.4,
+            impact_score=0.9,
+            key_topics=["Fed", "Rates"],
+        ),
+        SimpleNamespace(
+            sentiment="bullish",
+            sentiment_score=0.2,
+            impact_score=0.5,
+            key_topics=["rates", "Jobs"],
+        ),
+        SimpleNamespace(sentiment=None, sentiment_score=None, impact_score=None, key_topics=None),
+    ]
+
+    rolled_up = utils.aggregates_from_rollup(
+        sentiments=[a.sentiment for a in analyses],
+        topic_lists=[a.key_topics for a in analyses],
+        avg_sentiment=Decimal("0.3"),
+        avg_impact=Decimal("0.7"),
+    )
+
+    expected = utils.aggregate_analyses(analyses)
+    assert rolled_up.sentiment == expected.sentiment == "Bullish"
+    assert rolled_up.topics == expected.topics
+    assert rolled_up.avg_sentiment == pytest.approx(expected.avg_sentiment)
+    assert rolled_up.avg_impact == pytest.approx(expected.avg_impact)
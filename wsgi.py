@@ -8,10 +8,13 @@ the webapp package can be imported correctly when using gunicorn.
 import os
 import sys
 
-# Add src directory to Python path for the src layout
-src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
+# Add src directory to Python path for the src layout. realpath (already absolute) keeps
+# symlinked deployments from adding a second spelling of the same directory on re-import.
+# Resolved from __file__ rather than a bare "src" entry: the documented startup command
+# (`gunicorn -w 4 wsgi:app`) doesn't pass --chdir, so the working directory isn't guaranteed.
+_SRC_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "src")
+if _SRC_PATH not in sys.path:
+    sys.path.insert(0, _SRC_PATH)
 
 from webapp.wsgi import app  # noqa: E402
 